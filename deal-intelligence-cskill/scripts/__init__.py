@@ -39,9 +39,11 @@ from .risk_scanner import (
 )
 
 from .due_diligence_report import (
+    collect_company_data,
     generate_quick_profile,
     generate_investment_memo,
     generate_full_dd_report,
+    iter_full_dd_report,
     compare_companies
 )
 
@@ -72,8 +74,10 @@ __all__ = [
     'scan_reputation_risks',
     'get_risk_score',
     # Reports
+    'collect_company_data',
     'generate_quick_profile',
     'generate_investment_memo',
     'generate_full_dd_report',
+    'iter_full_dd_report',
     'compare_companies'
 ]
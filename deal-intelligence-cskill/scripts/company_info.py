@@ -3,7 +3,7 @@ Company Info Module - 企业信息模块
 获取企业基本信息、财务数据、高管团队
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 
 try:
@@ -141,12 +141,20 @@ def resolve_ticker(company_name: str) -> Optional[str]:
     return company_name.upper()
 
 
-def get_company_profile(company_name: str) -> Dict:
+def _select_fields(data: Dict, fields: Optional[Iterable[str]]) -> Dict:
+    """按需投影字段，fields 为 None 时返回完整数据"""
+    if fields is None:
+        return data
+    return {key: data[key] for key in fields if key in data}
+
+
+def get_company_profile(company_name: str, fields: Optional[Iterable[str]] = None) -> Dict:
     """
     获取公司基本资料
 
     Args:
         company_name: 公司名称或股票代码
+        fields: 可选，只返回指定字段（如 ("name", "industry")），默认返回全部字段
 
     Returns:
         公司资料字典
@@ -158,7 +166,7 @@ def get_company_profile(company_name: str) -> Dict:
             return {
                 "status": "success",
                 "is_public": False,
-                "data": data
+                "data": _select_fields(data, fields)
             }
 
     # 尝试获取上市公司数据
@@ -208,7 +216,7 @@ def get_company_profile(company_name: str) -> Dict:
         return {
             "status": "success",
             "is_public": True,
-            "data": profile
+            "data": _select_fields(profile, fields)
         }
 
     except Exception as e:
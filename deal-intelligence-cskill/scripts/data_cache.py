@@ -0,0 +1,131 @@
+"""
+Data Cache Module - 数据缓存模块
+将上游查询结果持久化到本地 SQLite，跨进程复用当天数据
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+# 缓存文件位置（设为 None 可关闭持久化缓存）
+CACHE_PATH: Optional[Path] = Path.home() / ".deal-intelligence" / "cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    func TEXT NOT NULL,
+    company TEXT NOT NULL,
+    day TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (func, company, day)
+)
+"""
+
+
+# 进程内共享的数据库连接（按缓存路径懒加载，建表与过期清理各只执行一次）
+_CONN: Optional[sqlite3.Connection] = None
+_CONN_PATH: Optional[Path] = None
+_CONN_LOCK = threading.Lock()
+
+
+def _connection() -> sqlite3.Connection:
+    """获取共享的缓存数据库连接（不存在时自动创建并清理非当天记录），调用方需持有 _CONN_LOCK"""
+    global _CONN, _CONN_PATH
+    if _CONN is None or _CONN_PATH != CACHE_PATH:
+        if _CONN is not None:
+            _CONN.close()
+            _CONN = None
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH, timeout=5, check_same_thread=False)
+        with conn:
+            conn.execute(_SCHEMA)
+            conn.execute("DELETE FROM results WHERE day < ?", (datetime.now().strftime("%Y-%m-%d"),))
+        _CONN, _CONN_PATH = conn, CACHE_PATH
+    return _CONN
+
+
+def _load(func: str, company: str, day: str) -> Optional[Dict]:
+    """读取缓存结果，未命中返回 None"""
+    with _CONN_LOCK:
+        row = _connection().execute(
+            "SELECT payload FROM results WHERE func = ? AND company = ? AND day = ?",
+            (func, company, day)
+        ).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def _store(func: str, company: str, day: str, payload: str) -> None:
+    """写入已序列化的缓存结果"""
+    with _CONN_LOCK:
+        conn = _connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (func, company, day, payload) VALUES (?, ?, ?, ?)",
+                (func, company, day, payload)
+            )
+
+
+def _normalize(result: Dict) -> Tuple[Dict, Optional[str]]:
+    """
+    将查询结果经 JSON 往返转换为普通字典/列表，使命中与未命中缓存时返回类型一致
+
+    Args:
+        result: 查询函数的原始结果
+
+    Returns:
+        (转换后的结果, JSON 文本)；无法序列化时返回 (原始结果, None)
+    """
+    try:
+        # default=dict：兼容返回只读映射（MappingProxyType）的查询函数
+        payload = json.dumps(result, ensure_ascii=False, default=dict)
+    except (TypeError, ValueError):
+        return result, None
+    return json.loads(payload), payload
+
+
+def persistent_cache(func: Callable[[str], Dict]) -> Callable[[str], Dict]:
+    """
+    按 (函数名, 公司名, 日期) 持久化缓存上游查询结果
+
+    仅缓存 status 为 success 的结果；缓存读写失败时直接回退到实时查询。
+
+    Args:
+        func: 以公司名称为唯一参数、返回字典的查询函数
+
+    Returns:
+        带缓存的查询函数
+    """
+    @wraps(func)
+    def wrapper(company_name: str) -> Dict:
+        """
+        优先返回当天的缓存结果，未命中时实时查询并写入缓存
+
+        Args:
+            company_name: 公司名称
+
+        Returns:
+            查询结果（无论是否命中缓存，均为 JSON 往返后的普通字典/列表）
+        """
+        if CACHE_PATH is None:
+            return _normalize(func(company_name))[0]
+
+        day = datetime.now().strftime("%Y-%m-%d")
+        try:
+            cached = _load(func.__name__, company_name, day)
+        except (sqlite3.Error, OSError, ValueError):
+            cached = None
+        if cached is not None:
+            return cached
+
+        result, payload = _normalize(func(company_name))
+        if payload is not None and result.get("status") == "success":
+            try:
+                _store(func.__name__, company_name, day, payload)
+            except (sqlite3.Error, OSError):
+                pass
+        return result
+
+    return wrapper
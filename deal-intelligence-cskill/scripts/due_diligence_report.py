@@ -3,8 +3,13 @@ Due Diligence Report Module - 尽调报告模块
 生成各类尽职调查报告
 """
 
+import io
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import product
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .data_cache import persistent_cache
 from .company_info import get_company_profile, get_company_financials, get_executive_team
 from .funding_analyzer import get_funding_history, analyze_funding_trajectory, estimate_valuation
 from .hiring_tracker import analyze_growth_signals, get_hiring_activity
@@ -12,6 +17,195 @@ from .news_aggregator import sentiment_analysis, get_company_news
 from .risk_scanner import get_risk_score, scan_legal_risks
 
 
+# 报告数据源：键 -> 上游获取函数（结果按天持久化缓存，跨进程复用）
+DATA_SOURCES = {
+    "profile": persistent_cache(get_company_profile),
+    "financials": persistent_cache(get_company_financials),
+    "executives": persistent_cache(get_executive_team),
+    "funding": persistent_cache(analyze_funding_trajectory),
+    "valuation": persistent_cache(estimate_valuation),
+    "growth": persistent_cache(analyze_growth_signals),
+    "hiring": persistent_cache(get_hiring_activity),
+    "sentiment": persistent_cache(sentiment_analysis),
+    "news": persistent_cache(get_company_news),
+    "risk": persistent_cache(get_risk_score),
+    "legal": persistent_cache(scan_legal_risks),
+}
+
+# 投资备忘录所需的数据源
+MEMO_SOURCES = ("profile", "funding", "growth", "sentiment", "risk")
+
+# 提前判断备忘录结论时先获取的数据源
+EARLY_ABORT_SOURCES = ("profile", "risk", "growth")
+
+# 因结论已确定而跳过获取的数据源占位
+_SKIPPED_SOURCE = {"status": "skipped", "message": "综合评分已低于关注线，未获取此数据"}
+
+# 评分数据源尚未获取时的最好情况，用于估算综合评分上限
+_BEST_CASE_SCORES = {
+    "risk": {"status": "success", "overall_score": 0},
+    "growth": {"status": "success", "overall_assessment": {"score": 100}},
+    "sentiment": {"status": "success", "sentiment_summary": {"score": 100}},
+}
+
+# 评分数据源尚未获取时的获取失败情况（所有评分源都失败时综合评分回退为50，可能高于最好情况）
+_FAILED_SCORE_SOURCE = {"status": "not_found"}
+
+# 快速概况只需要的公司资料字段
+QUICK_PROFILE_FIELDS = ("name", "ticker", "industry", "market_cap_formatted", "valuation")
+
+# 多公司对比所需的数据源
+COMPARE_SOURCES = ("profile", "risk", "growth", "funding")
+
+# 报告时间戳格式
+_REPORT_TS_FMT = "%Y-%m-%d %H:%M"
+_REPORT_DATE_FMT = "%Y年%m月%d日"
+
+# 风险严重程度标识
+_SEVERITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+# 排名奖牌
+_MEDALS = ("🥇", "🥈", "🥉")
+
+# 公司概况表格行：(标签, 字段, 缺省值, 格式)
+_PUBLIC_ROWS = (
+    ("公司名称", "name", "N/A", "{}"),
+    ("股票代码", "ticker", "N/A", "{}"),
+    ("行业", "industry", "N/A", "{}"),
+    ("板块", "sector", "N/A", "{}"),
+    ("总部", "headquarters", "N/A", "{}"),
+    ("员工数", "employees", "N/A", "{}"),
+    ("市值", "market_cap_formatted", "N/A", "{}"),
+    ("当前股价", "current_price", 0, "${:.2f}"),
+    ("52周最高", "52_week_high", 0, "${:.2f}"),
+    ("52周最低", "52_week_low", 0, "${:.2f}"),
+)
+_PRIVATE_ROWS = (
+    ("公司名称", "name", "N/A", "{}"),
+    ("英文名", "name_en", "N/A", "{}"),
+    ("成立时间", "founded", "N/A", "{}"),
+    ("总部", "headquarters", "N/A", "{}"),
+    ("行业", "industry", "N/A", "{}"),
+    ("员工数", "employees", "N/A", "{}"),
+    ("估值", "valuation", "N/A", "{}"),
+    ("创始人", "founder", "N/A", "{}"),
+)
+
+# 综合评分关注线：低于此分数的结论为"谨慎"
+_WATCH_THRESHOLD = 50
+
+# 综合评分档位：(最低分, 总体评价, 评价说明, 备忘录建议)，按分数从高到低排列
+_VERDICTS = (
+    (75, "✅ 推荐关注", "公司基本面良好，增长势头积极，风险可控", "✅ **建议**: 积极关注，适合深入接洽"),
+    (_WATCH_THRESHOLD, "🟡 中性评估", "公司存在一定亮点，但也有需要关注的风险", "🟡 **建议**: 可以接触，需完成详细尽调"),
+    (float("-inf"), "⚠️ 建议谨慎", "公司存在较多风险因素，需仔细评估", "⚠️ **建议**: 谨慎评估，存在较多风险因素"),
+)
+
+
+# 报告静态模板：固定文字在模块加载时拼好，渲染时只填充动态字段
+_MEMO_CLOSING = """## 📋 建议下一步
+1. 安排管理层会面
+2. 获取详细财务数据
+3. 进行客户/用户访谈
+4. 聘请专业机构进行法律尽调
+
+""" + "=" * 60 + """
+*此报告基于公开信息生成，仅供参考*"""
+
+_FULL_COVER_TEMPLATE = "=" * 70 + """
+
+# 📊 商业尽职调查报告
+## {company_name}
+
+**报告日期**: {report_date}
+**报告类型**: 综合尽调报告
+**机密等级**: 仅供内部使用
+
+""" + "=" * 70 + """
+
+## 目录
+1. 执行摘要
+2. 公司概况
+3. 管理团队
+4. 财务分析
+5. 融资历史
+6. 增长分析
+7. 舆情分析
+8. 风险评估
+9. 投资建议
+10. 附录
+
+"""
+
+_FULL_CLOSING_TEMPLATE = """---
+## 9. 投资建议
+
+**综合评分**: {overall_score:.0f}/100
+**总体评价**: {verdict}
+
+### 优势
+- [基于分析自动生成]
+
+### 风险
+- [基于分析自动生成]
+
+### 建议下一步
+1. 安排与管理层深度交流
+2. 获取详细财务数据进行审计
+3. 进行客户/用户访谈
+4. 聘请专业机构进行法律尽调
+5. 评估行业竞争格局
+
+---
+## 10. 附录
+
+### 数据来源
+- 公开市场数据 (yfinance)
+- 模拟融资/招聘/新闻数据
+- 实际应用建议对接: 天眼查、Crunchbase、LinkedIn等API
+
+### 免责声明
+本报告基于公开信息生成，仅供参考，不构成投资建议。
+投资决策前请进行独立的尽职调查。
+
+""" + "=" * 70
+
+
+def _verdict(score: float) -> Tuple[str, str, str]:
+    """根据综合评分返回 (总体评价, 评价说明, 备忘录建议)"""
+    for threshold, verdict, detail, advice in _VERDICTS:
+        if score >= threshold:
+            return verdict, detail, advice
+    return _VERDICTS[-1][1:]
+
+
+def collect_company_data(company_name: str,
+                         sources: Optional[Iterable[str]] = None,
+                         prefetched: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict]:
+    """
+    并发收集报告所需的上游数据（一次获取，多个报告共享）
+
+    Args:
+        company_name: 公司名称
+        sources: 需要的数据源键（见 DATA_SOURCES），默认全部
+        prefetched: 已获取的数据，其中已有的键不会重复请求
+
+    Returns:
+        数据源键 -> 上游返回结果
+    """
+    keys = tuple(sources) if sources is not None else tuple(DATA_SOURCES)
+    bundle = dict(prefetched or {})
+    missing = [key for key in keys if key not in bundle]
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            futures = {key: executor.submit(DATA_SOURCES[key], company_name) for key in missing}
+        for key, future in futures.items():
+            bundle[key] = future.result()
+
+    return bundle
+
+
 def generate_quick_profile(company_name: str) -> str:
     """
     生成快速公司概况（一句话版本）
@@ -22,7 +216,7 @@ def generate_quick_profile(company_name: str) -> str:
     Returns:
         简洁概况
     """
-    profile = get_company_profile(company_name)
+    profile = get_company_profile(company_name, fields=QUICK_PROFILE_FIELDS)
 
     if profile.get("status") != "success":
         return f"❌ 未找到 {company_name} 的信息"
@@ -44,484 +238,452 @@ def generate_quick_profile(company_name: str) -> str:
         return f"🏢 {name} | {industry} | 估值: {valuation} | 私有公司"
 
 
-def generate_investment_memo(company_name: str) -> str:
+def generate_investment_memo(company_name: str, *, data: Optional[Dict[str, Dict]] = None,
+                             early_abort: bool = False) -> str:
     """
     生成投资备忘录
 
     Args:
         company_name: 公司名称
+        data: 可选，collect_company_data 返回的数据包，缺失部分会自动补齐
+        early_abort: 先获取资料、风险和增长数据，若综合评分上限已低于关注线，
+            则跳过融资和舆情数据的获取，直接生成"谨慎评估"备忘录
 
     Returns:
         投资备忘录（Markdown格式）
     """
     # 收集数据
-    profile = get_company_profile(company_name)
-    funding = analyze_funding_trajectory(company_name)
-    growth = analyze_growth_signals(company_name)
-    sentiment = sentiment_analysis(company_name)
-    risk = get_risk_score(company_name)
-
-    memo = []
+    generated_at = datetime.now().strftime(_REPORT_TS_FMT)
+    prefetched = data
+    if early_abort:
+        prefetched = collect_company_data(company_name, EARLY_ABORT_SOURCES, prefetched=data)
+        if _score_upper_bound(prefetched) < _WATCH_THRESHOLD:
+            for key in MEMO_SOURCES:
+                prefetched.setdefault(key, _SKIPPED_SOURCE)
+    bundle = collect_company_data(company_name, MEMO_SOURCES, prefetched=prefetched)
+    profile = bundle["profile"]
+    funding = bundle["funding"]
+    growth = bundle["growth"]
+    sentiment = bundle["sentiment"]
+    risk = bundle["risk"]
+
+    buf = io.StringIO()
 
     # 标题
-    memo.append("=" * 60)
-    memo.append(f"📋 投资备忘录: {company_name}")
-    memo.append(f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    memo.append("=" * 60)
-    memo.append("")
+    buf.write(f"""{"=" * 60}
+📋 投资备忘录: {company_name}
+生成时间: {generated_at}
+{"=" * 60}
+
+""")
 
     # 执行摘要
-    memo.append("## 📌 执行摘要")
+    buf.write("## 📌 执行摘要\n")
     if profile.get("status") == "success":
         data = profile.get("data", {})
         if profile.get("is_public"):
-            memo.append(f"- **公司**: {data.get('name', company_name)} ({data.get('ticker', '')})")
-            memo.append(f"- **行业**: {data.get('industry', 'N/A')}")
-            memo.append(f"- **市值**: {data.get('market_cap_formatted', 'N/A')}")
+            buf.write(f"""- **公司**: {data.get('name', company_name)} ({data.get('ticker', '')})
+- **行业**: {data.get('industry', 'N/A')}
+- **市值**: {data.get('market_cap_formatted', 'N/A')}
+""")
         else:
-            memo.append(f"- **公司**: {data.get('name', company_name)}")
-            memo.append(f"- **行业**: {data.get('industry', 'N/A')}")
-            memo.append(f"- **估值**: {data.get('valuation', 'N/A')}")
-            memo.append(f"- **状态**: 私有公司")
+            buf.write(f"""- **公司**: {data.get('name', company_name)}
+- **行业**: {data.get('industry', 'N/A')}
+- **估值**: {data.get('valuation', 'N/A')}
+- **状态**: 私有公司
+""")
 
     # 投资建议
-    memo.append("")
-    memo.append("### 投资建议")
     overall_score = calculate_overall_score(risk, growth, sentiment)
-    if overall_score >= 75:
-        memo.append("✅ **建议**: 积极关注，适合深入接洽")
-    elif overall_score >= 50:
-        memo.append("🟡 **建议**: 可以接触，需完成详细尽调")
-    else:
-        memo.append("⚠️ **建议**: 谨慎评估，存在较多风险因素")
-    memo.append("")
+    _, _, advice = _verdict(overall_score)
+    buf.write(f"""
+### 投资建议
+{advice}
+
+""")
 
     # 融资情况
-    memo.append("## 💰 融资情况")
+    buf.write("## 💰 融资情况\n")
     if funding.get("status") == "success":
         summary = funding.get("summary", {})
-        memo.append(f"- **累计融资**: {summary.get('total_raised', 'N/A')}")
-        memo.append(f"- **最新估值**: {summary.get('latest_valuation', 'N/A')}")
-        memo.append(f"- **最新轮次**: {summary.get('latest_round', 'N/A')} ({summary.get('latest_date', '')})")
-        memo.append(f"- **融资节奏**: {funding.get('trajectory_analysis', {}).get('funding_velocity', 'N/A')}")
-        memo.append(f"- **发展阶段**: {funding.get('trajectory_analysis', {}).get('stage', 'N/A')}")
-
+        trajectory = funding.get("trajectory_analysis", {})
+        buf.write(f"""- **累计融资**: {summary.get('total_raised', 'N/A')}
+- **最新估值**: {summary.get('latest_valuation', 'N/A')}
+- **最新轮次**: {summary.get('latest_round', 'N/A')} ({summary.get('latest_date', '')})
+- **融资节奏**: {trajectory.get('funding_velocity', 'N/A')}
+- **发展阶段**: {trajectory.get('stage', 'N/A')}
+""")
         if funding.get("notable_investors"):
-            memo.append(f"- **知名投资人**: {', '.join(funding['notable_investors'][:5])}")
+            buf.write(f"- **知名投资人**: {', '.join(funding['notable_investors'][:5])}\n")
     else:
-        memo.append("- 融资信息不可用")
-    memo.append("")
+        buf.write("- 融资信息不可用\n")
+    buf.write("\n")
 
     # 增长信号
-    memo.append("## 📈 增长信号")
+    buf.write("## 📈 增长信号\n")
     if growth.get("status") == "success":
         assessment = growth.get("overall_assessment", {})
-        memo.append(f"- **信号强度**: {assessment.get('signal', 'N/A')}")
-        memo.append(f"- **招聘规模**: {assessment.get('total_openings', 0)}个岗位")
-        memo.append(f"- **同比变化**: {assessment.get('yoy_change', 'N/A')}")
-
+        buf.write(f"""- **信号强度**: {assessment.get('signal', 'N/A')}
+- **招聘规模**: {assessment.get('total_openings', 0)}个岗位
+- **同比变化**: {assessment.get('yoy_change', 'N/A')}
+""")
         if growth.get("strategic_focus"):
-            memo.append(f"- **战略重点**: {', '.join(growth['strategic_focus'][:3])}")
+            buf.write(f"- **战略重点**: {', '.join(growth['strategic_focus'][:3])}\n")
     else:
-        memo.append("- 增长信号数据不可用")
-    memo.append("")
+        buf.write("- 增长信号数据不可用\n")
+    buf.write("\n")
 
     # 舆情分析
-    memo.append("## 📰 舆情分析")
+    buf.write("## 📰 舆情分析\n")
     if sentiment.get("status") == "success":
         sent_summary = sentiment.get("sentiment_summary", {})
-        memo.append(f"- **舆情评分**: {sent_summary.get('score', 50)}/100")
-        memo.append(f"- **整体倾向**: {sent_summary.get('emoji', '')} {sent_summary.get('overall', 'N/A')}")
-
+        buf.write(f"""- **舆情评分**: {sent_summary.get('score', 50)}/100
+- **整体倾向**: {sent_summary.get('emoji', '')} {sent_summary.get('overall', 'N/A')}
+""")
         if sentiment.get("main_topics"):
             topics = [t[0] for t in sentiment["main_topics"][:3]]
-            memo.append(f"- **热点话题**: {', '.join(topics)}")
+            buf.write(f"- **热点话题**: {', '.join(topics)}\n")
     else:
-        memo.append("- 舆情数据不可用")
-    memo.append("")
+        buf.write("- 舆情数据不可用\n")
+    buf.write("\n")
 
     # 风险评估
-    memo.append("## ⚠️ 风险评估")
+    buf.write("## ⚠️ 风险评估\n")
     if risk.get("status") == "success":
-        memo.append(f"- **风险等级**: {risk.get('risk_level', 'N/A')}")
-        memo.append(f"- **风险评分**: {risk.get('overall_score', 50)}/100")
-        memo.append(f"- **投资建议**: {risk.get('investment_advice', 'N/A')}")
-
+        buf.write(f"""- **风险等级**: {risk.get('risk_level', 'N/A')}
+- **风险评分**: {risk.get('overall_score', 50)}/100
+- **投资建议**: {risk.get('investment_advice', 'N/A')}
+""")
         if risk.get("top_risks"):
-            memo.append("- **主要风险**:")
-            for r in risk["top_risks"][:3]:
-                severity_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(r.get("severity", ""), "")
-                memo.append(f"  - {severity_emoji} {r.get('type', '')}: {r.get('description', '')}")
+            rows = "".join(
+                f"  - {_SEVERITY_EMOJI.get(r.get('severity', ''), '')} {r.get('type', '')}: {r.get('description', '')}\n"
+                for r in risk["top_risks"][:3]
+            )
+            buf.write(f"- **主要风险**:\n{rows}")
     else:
-        memo.append("- 风险数据不可用")
-    memo.append("")
+        buf.write("- 风险数据不可用\n")
+    buf.write("\n")
 
     # 下一步行动
-    memo.append("## 📋 建议下一步")
-    memo.append("1. 安排管理层会面")
-    memo.append("2. 获取详细财务数据")
-    memo.append("3. 进行客户/用户访谈")
-    memo.append("4. 聘请专业机构进行法律尽调")
-    memo.append("")
+    buf.write(_MEMO_CLOSING)
+
+    return buf.getvalue()
 
-    memo.append("=" * 60)
-    memo.append("*此报告基于公开信息生成，仅供参考*")
 
-    return "\n".join(memo)
+def _score_upper_bound(bundle: Dict[str, Dict]) -> float:
+    """
+    估算综合评分上限：已获取的数据按实际得分计，未获取的数据源分别按最好情况和获取失败计，取最大值
+
+    综合评分只合成获取成功的数据源，全部失败时回退为50，因此未获取的数据源失败反而可能得到更高的评分
+    """
+    pending = [key for key in _BEST_CASE_SCORES if key not in bundle]
+    bound = float("-inf")
+    for outcomes in product((True, False), repeat=len(pending)):
+        filled = dict(bundle)
+        for key, ok in zip(pending, outcomes):
+            filled[key] = _BEST_CASE_SCORES[key] if ok else _FAILED_SCORE_SOURCE
+        bound = max(bound, calculate_overall_score(filled["risk"], filled["growth"], filled["sentiment"]))
+    return bound
 
 
 def calculate_overall_score(risk: Dict, growth: Dict, sentiment: Dict) -> float:
     """计算综合评分"""
+    risk_ok = risk.get("status") == "success"
+    growth_ok = growth.get("status") == "success"
+    sent_ok = sentiment.get("status") == "success"
+
+    return _weighted_score(
+        risk.get("overall_score", 50) if risk_ok else None,
+        growth.get("overall_assessment", {}).get("score", 50) if growth_ok else None,
+        sentiment.get("sentiment_summary", {}).get("score", 50) if sent_ok else None,
+        risk_ok,
+        growth_ok,
+        sent_ok,
+    )
+
+
+@lru_cache(maxsize=512)
+def _weighted_score(risk_s: Optional[float], growth_s: Optional[float], sent_s: Optional[float],
+                    risk_ok: bool, growth_ok: bool, sent_ok: bool) -> float:
+    """按权重合成综合评分（参数均为原始值，可直接作为缓存键）"""
     scores = []
 
     # 风险评分（反向，风险低得分高）
-    if risk.get("status") == "success":
-        risk_score = 100 - risk.get("overall_score", 50)
-        scores.append(risk_score * 0.4)  # 权重40%
+    if risk_ok:
+        scores.append((100 - risk_s) * 0.4)  # 权重40%
 
     # 增长信号评分
-    if growth.get("status") == "success":
-        growth_score = growth.get("overall_assessment", {}).get("score", 50)
-        scores.append(growth_score * 0.35)  # 权重35%
+    if growth_ok:
+        scores.append(growth_s * 0.35)  # 权重35%
 
     # 舆情评分
-    if sentiment.get("status") == "success":
-        sent_score = sentiment.get("sentiment_summary", {}).get("score", 50)
-        scores.append(sent_score * 0.25)  # 权重25%
+    if sent_ok:
+        scores.append(sent_s * 0.25)  # 权重25%
 
     return sum(scores) if scores else 50
 
 
-def generate_full_dd_report(company_name: str) -> str:
+def iter_full_dd_report(company_name: str, *, data: Optional[Dict[str, Dict]] = None) -> Iterator[str]:
+    """
+    逐段生成完整尽调报告（流式输出）
+
+    所有数据源在开始时并发提交，每个章节在其依赖的数据就绪后立即输出，
+    调用方可以边生成边写出，无需等待整份报告拼接完成。
+
+    Args:
+        company_name: 公司名称
+        data: 可选，collect_company_data 返回的数据包，缺失部分会自动补齐
+
+    Yields:
+        报告文本片段（按章节顺序，直接拼接即为完整报告）
+    """
+    prefetched = data or {}
+    with ThreadPoolExecutor(max_workers=len(DATA_SOURCES)) as executor:
+        futures = {}
+        for key, fetch in DATA_SOURCES.items():
+            if key in prefetched:
+                futures[key] = Future()
+                futures[key].set_result(prefetched[key])
+            else:
+                futures[key] = executor.submit(fetch, company_name)
+
+        yield from _render_full_dd_report(company_name, futures)
+
+
+def generate_full_dd_report(company_name: str, *, data: Optional[Dict[str, Dict]] = None) -> str:
     """
     生成完整尽调报告
 
     Args:
         company_name: 公司名称
+        data: 可选，collect_company_data 返回的数据包，缺失部分会自动补齐
 
     Returns:
         完整尽调报告（Markdown格式）
     """
-    # 收集所有数据
-    profile = get_company_profile(company_name)
-    financials = get_company_financials(company_name)
-    executives = get_executive_team(company_name)
-    funding = analyze_funding_trajectory(company_name)
-    valuation = estimate_valuation(company_name)
-    growth = analyze_growth_signals(company_name)
-    hiring = get_hiring_activity(company_name)
-    sentiment = sentiment_analysis(company_name)
-    news = get_company_news(company_name)
-    risk = get_risk_score(company_name)
-    legal = scan_legal_risks(company_name)
-
-    report = []
-
-    # 封面
-    report.append("=" * 70)
-    report.append("")
-    report.append(f"# 📊 商业尽职调查报告")
-    report.append(f"## {company_name}")
-    report.append("")
-    report.append(f"**报告日期**: {datetime.now().strftime('%Y年%m月%d日')}")
-    report.append(f"**报告类型**: 综合尽调报告")
-    report.append(f"**机密等级**: 仅供内部使用")
-    report.append("")
-    report.append("=" * 70)
-    report.append("")
-
-    # 目录
-    report.append("## 目录")
-    report.append("1. 执行摘要")
-    report.append("2. 公司概况")
-    report.append("3. 管理团队")
-    report.append("4. 财务分析")
-    report.append("5. 融资历史")
-    report.append("6. 增长分析")
-    report.append("7. 舆情分析")
-    report.append("8. 风险评估")
-    report.append("9. 投资建议")
-    report.append("10. 附录")
-    report.append("")
+    return "".join(iter_full_dd_report(company_name, data=data))
 
-    # 1. 执行摘要
-    report.append("---")
-    report.append("## 1. 执行摘要")
-    report.append("")
 
-    overall_score = calculate_overall_score(risk, growth, sentiment)
+def _render_full_dd_report(company_name: str, futures: Dict[str, Future]) -> Iterator[str]:
+    """按章节顺序渲染完整尽调报告，每个章节只等待其依赖的数据源"""
+    report_date = datetime.now().strftime(_REPORT_DATE_FMT)
 
-    if overall_score >= 75:
-        verdict = "✅ 推荐关注"
-        verdict_detail = "公司基本面良好，增长势头积极，风险可控"
-    elif overall_score >= 50:
-        verdict = "🟡 中性评估"
-        verdict_detail = "公司存在一定亮点，但也有需要关注的风险"
-    else:
-        verdict = "⚠️ 建议谨慎"
-        verdict_detail = "公司存在较多风险因素，需仔细评估"
+    # 封面 + 目录
+    yield _FULL_COVER_TEMPLATE.format(company_name=company_name, report_date=report_date)
 
-    report.append(f"**综合评分**: {overall_score:.0f}/100")
-    report.append(f"**总体评价**: {verdict}")
-    report.append(f"**评价说明**: {verdict_detail}")
-    report.append("")
+    # 1. 执行摘要
+    profile = futures["profile"].result()
+    funding = futures["funding"].result()
+    growth = futures["growth"].result()
+    sentiment = futures["sentiment"].result()
+    risk = futures["risk"].result()
+    overall_score = calculate_overall_score(risk, growth, sentiment)
+    verdict, verdict_detail, _ = _verdict(overall_score)
+
+    # 各数据源的状态与常用子字典只解析一次，后续章节直接复用
+    profile_ok = profile.get("status") == "success"
+    funding_ok = funding.get("status") == "success"
+    growth_ok = growth.get("status") == "success"
+    sentiment_ok = sentiment.get("status") == "success"
+    risk_ok = risk.get("status") == "success"
+    data = profile.get("data", {}) if profile_ok else {}
+    trajectory = funding.get("trajectory_analysis", {}).get
+    assessment = growth.get("overall_assessment", {}).get
+
+    yield f"""---
+## 1. 执行摘要
+
+**综合评分**: {overall_score:.0f}/100
+**总体评价**: {verdict}
+**评价说明**: {verdict_detail}
+
+### 关键发现
+"""
 
     # 关键发现
-    report.append("### 关键发现")
-    if profile.get("status") == "success":
-        data = profile.get("data", {})
-        report.append(f"- 行业地位: {data.get('industry', 'N/A')}")
-    if funding.get("status") == "success":
-        report.append(f"- 融资阶段: {funding.get('trajectory_analysis', {}).get('stage', 'N/A')}")
-    if growth.get("status") == "success":
-        report.append(f"- 增长信号: {growth.get('overall_assessment', {}).get('signal', 'N/A')}")
-    if risk.get("status") == "success":
-        report.append(f"- 风险等级: {risk.get('risk_level', 'N/A')}")
-    report.append("")
+    if profile_ok:
+        yield f"- 行业地位: {data.get('industry', 'N/A')}\n"
+    if funding_ok:
+        yield f"- 融资阶段: {trajectory('stage', 'N/A')}\n"
+    if growth_ok:
+        yield f"- 增长信号: {assessment('signal', 'N/A')}\n"
+    if risk_ok:
+        yield f"- 风险等级: {risk.get('risk_level', 'N/A')}\n"
+    yield "\n"
 
     # 2. 公司概况
-    report.append("---")
-    report.append("## 2. 公司概况")
-    report.append("")
+    yield "---\n## 2. 公司概况\n\n"
 
-    if profile.get("status") == "success":
-        data = profile.get("data", {})
-        if profile.get("is_public"):
-            report.append(f"| 项目 | 内容 |")
-            report.append(f"|------|------|")
-            report.append(f"| 公司名称 | {data.get('name', 'N/A')} |")
-            report.append(f"| 股票代码 | {data.get('ticker', 'N/A')} |")
-            report.append(f"| 行业 | {data.get('industry', 'N/A')} |")
-            report.append(f"| 板块 | {data.get('sector', 'N/A')} |")
-            report.append(f"| 总部 | {data.get('headquarters', 'N/A')} |")
-            report.append(f"| 员工数 | {data.get('employees', 'N/A')} |")
-            report.append(f"| 市值 | {data.get('market_cap_formatted', 'N/A')} |")
-            report.append(f"| 当前股价 | ${data.get('current_price', 0):.2f} |")
-            report.append(f"| 52周最高 | ${data.get('52_week_high', 0):.2f} |")
-            report.append(f"| 52周最低 | ${data.get('52_week_low', 0):.2f} |")
-        else:
-            report.append(f"| 项目 | 内容 |")
-            report.append(f"|------|------|")
-            report.append(f"| 公司名称 | {data.get('name', 'N/A')} |")
-            report.append(f"| 英文名 | {data.get('name_en', 'N/A')} |")
-            report.append(f"| 成立时间 | {data.get('founded', 'N/A')} |")
-            report.append(f"| 总部 | {data.get('headquarters', 'N/A')} |")
-            report.append(f"| 行业 | {data.get('industry', 'N/A')} |")
-            report.append(f"| 员工数 | {data.get('employees', 'N/A')} |")
-            report.append(f"| 估值 | {data.get('valuation', 'N/A')} |")
-            report.append(f"| 创始人 | {data.get('founder', 'N/A')} |")
-
-            if data.get("products"):
-                report.append(f"| 主要产品 | {', '.join(data['products'][:5])} |")
-
-        if data.get("description"):
-            report.append("")
-            report.append("**公司简介**:")
-            report.append(data.get("description", ""))
+    if profile_ok:
+        rows = _PUBLIC_ROWS if profile.get("is_public") else _PRIVATE_ROWS
+        yield "| 项目 | 内容 |\n|------|------|\n" + "".join(
+            f"| {label} | {fmt.format(data.get(key, default))} |\n" for label, key, default, fmt in rows
+        )
+
+        if not profile.get("is_public") and data.get("products"):
+            yield f"| 主要产品 | {', '.join(data['products'][:5])} |\n"
+
+        description = data.get("description")
+        if description:
+            yield f"\n**公司简介**:\n{description}\n"
     else:
-        report.append("*公司基本信息不可用*")
-    report.append("")
+        yield "*公司基本信息不可用*\n"
+    yield "\n"
 
     # 3. 管理团队
-    report.append("---")
-    report.append("## 3. 管理团队")
-    report.append("")
+    executives = futures["executives"].result()
+    yield "---\n## 3. 管理团队\n\n"
 
     if executives.get("status") == "success":
         execs = executives.get("executives", [])
         if execs:
-            report.append("| 姓名 | 职位 | 年龄 | 薪酬 |")
-            report.append("|------|------|------|------|")
-            for exec in execs[:10]:
-                report.append(f"| {exec.get('name', 'N/A')} | {exec.get('title', 'N/A')} | {exec.get('age', 'N/A')} | {exec.get('compensation', 'N/A')} |")
+            rows = "".join(
+                f"| {e.get('name', 'N/A')} | {e.get('title', 'N/A')} | {e.get('age', 'N/A')} | {e.get('compensation', 'N/A')} |\n"
+                for e in execs[:10]
+            )
+            yield f"| 姓名 | 职位 | 年龄 | 薪酬 |\n|------|------|------|------|\n{rows}"
         else:
-            report.append("*高管信息暂无*")
+            yield "*高管信息暂无*\n"
     else:
-        report.append("*高管信息不可用*")
-    report.append("")
+        yield "*高管信息不可用*\n"
+    yield "\n"
 
     # 4. 财务分析
-    report.append("---")
-    report.append("## 4. 财务分析")
-    report.append("")
+    financials = futures["financials"].result()
+    yield "---\n## 4. 财务分析\n\n"
 
     if financials.get("status") == "success":
-        fin = financials.get("data", {})
-
-        report.append("### 估值指标")
-        val = fin.get("valuation", {})
-        report.append(f"- 市值: {val.get('market_cap_formatted', 'N/A')}")
-        report.append(f"- P/E (TTM): {val.get('pe_ratio', 'N/A')}")
-        report.append(f"- P/E (Forward): {val.get('forward_pe', 'N/A')}")
-        report.append(f"- P/B: {val.get('pb_ratio', 'N/A')}")
-        report.append(f"- P/S: {val.get('ps_ratio', 'N/A')}")
-        report.append("")
-
-        report.append("### 盈利能力")
-        prof = fin.get("profitability", {})
-        report.append(f"- 营收: {prof.get('revenue_formatted', 'N/A')}")
-        report.append(f"- 毛利率: {prof.get('gross_margin', 'N/A')}")
-        report.append(f"- 营业利润率: {prof.get('operating_margin', 'N/A')}")
-        report.append(f"- 净利率: {prof.get('profit_margin', 'N/A')}")
-        report.append(f"- ROE: {prof.get('roe', 'N/A')}")
-        report.append("")
-
-        report.append("### 财务健康")
-        health = fin.get("financial_health", {})
-        report.append(f"- 现金: {health.get('total_cash_formatted', 'N/A')}")
-        report.append(f"- 负债: {health.get('total_debt_formatted', 'N/A')}")
-        report.append(f"- 资产负债率: {health.get('debt_to_equity', 'N/A')}")
-        report.append(f"- 流动比率: {health.get('current_ratio', 'N/A')}")
+        fin = financials.get("data", {}).get
+        val = fin("valuation", {}).get
+        prof = fin("profitability", {}).get
+        health = fin("financial_health", {}).get
+
+        yield f"""### 估值指标
+- 市值: {val('market_cap_formatted', 'N/A')}
+- P/E (TTM): {val('pe_ratio', 'N/A')}
+- P/E (Forward): {val('forward_pe', 'N/A')}
+- P/B: {val('pb_ratio', 'N/A')}
+- P/S: {val('ps_ratio', 'N/A')}
+
+### 盈利能力
+- 营收: {prof('revenue_formatted', 'N/A')}
+- 毛利率: {prof('gross_margin', 'N/A')}
+- 营业利润率: {prof('operating_margin', 'N/A')}
+- 净利率: {prof('profit_margin', 'N/A')}
+- ROE: {prof('roe', 'N/A')}
+
+### 财务健康
+- 现金: {health('total_cash_formatted', 'N/A')}
+- 负债: {health('total_debt_formatted', 'N/A')}
+- 资产负债率: {health('debt_to_equity', 'N/A')}
+- 流动比率: {health('current_ratio', 'N/A')}
+"""
     else:
-        report.append("*财务数据不可用（可能是私有公司）*")
-    report.append("")
+        yield "*财务数据不可用（可能是私有公司）*\n"
+    yield "\n"
 
     # 5. 融资历史
-    report.append("---")
-    report.append("## 5. 融资历史")
-    report.append("")
+    yield "---\n## 5. 融资历史\n\n"
 
-    if funding.get("status") == "success":
-        summary = funding.get("summary", {})
-        report.append(f"- **累计融资**: {summary.get('total_raised', 'N/A')}")
-        report.append(f"- **最新估值**: {summary.get('latest_valuation', 'N/A')}")
-        report.append(f"- **融资轮次**: {summary.get('total_rounds', 0)}轮")
-        report.append(f"- **发展阶段**: {funding.get('trajectory_analysis', {}).get('stage', 'N/A')}")
-        report.append(f"- **融资节奏**: {funding.get('trajectory_analysis', {}).get('funding_velocity', 'N/A')}")
-        report.append("")
+    if funding_ok:
+        summary = funding.get("summary", {}).get
+        yield f"""- **累计融资**: {summary('total_raised', 'N/A')}
+- **最新估值**: {summary('latest_valuation', 'N/A')}
+- **融资轮次**: {summary('total_rounds', 0)}轮
+- **发展阶段**: {trajectory('stage', 'N/A')}
+- **融资节奏**: {trajectory('funding_velocity', 'N/A')}
+
+"""
 
         if funding.get("notable_investors"):
-            report.append(f"**知名投资人**: {', '.join(funding['notable_investors'])}")
-            report.append("")
+            yield f"**知名投资人**: {', '.join(funding['notable_investors'])}\n\n"
 
         if funding.get("repeat_investors"):
-            report.append(f"**多轮投资人**: {', '.join(funding['repeat_investors'])}")
+            yield f"**多轮投资人**: {', '.join(funding['repeat_investors'])}\n"
     else:
-        report.append("*融资历史不可用*")
-    report.append("")
+        yield "*融资历史不可用*\n"
+    yield "\n"
 
     # 6. 增长分析
-    report.append("---")
-    report.append("## 6. 增长分析")
-    report.append("")
+    yield "---\n## 6. 增长分析\n\n"
 
-    if growth.get("status") == "success":
-        assessment = growth.get("overall_assessment", {})
-        report.append(f"- **增长信号**: {assessment.get('signal', 'N/A')}")
-        report.append(f"- **信号得分**: {assessment.get('score', 0)}/100")
-        report.append(f"- **招聘规模**: {assessment.get('total_openings', 0)}个岗位")
-        report.append(f"- **同比变化**: {assessment.get('yoy_change', 'N/A')}")
-        report.append("")
+    if growth_ok:
+        yield f"""- **增长信号**: {assessment('signal', 'N/A')}
+- **信号得分**: {assessment('score', 0)}/100
+- **招聘规模**: {assessment('total_openings', 0)}个岗位
+- **同比变化**: {assessment('yoy_change', 'N/A')}
+
+"""
 
         if growth.get("strategic_focus"):
-            report.append(f"**战略重点领域**: {', '.join(growth['strategic_focus'])}")
-            report.append("")
+            yield f"**战略重点领域**: {', '.join(growth['strategic_focus'])}\n\n"
 
         if growth.get("department_signals"):
-            report.append("### 部门增长明细")
-            for dept in growth["department_signals"][:5]:
-                report.append(f"- {dept.get('signal', '')}")
+            rows = "".join(f"- {dept.get('signal', '')}\n" for dept in growth["department_signals"][:5])
+            yield f"### 部门增长明细\n{rows}"
     else:
-        report.append("*增长数据不可用*")
-    report.append("")
+        yield "*增长数据不可用*\n"
+    yield "\n"
 
     # 7. 舆情分析
-    report.append("---")
-    report.append("## 7. 舆情分析")
-    report.append("")
+    yield "---\n## 7. 舆情分析\n\n"
 
-    if sentiment.get("status") == "success":
-        sent = sentiment.get("sentiment_summary", {})
-        report.append(f"- **舆情评分**: {sent.get('score', 50)}/100")
-        report.append(f"- **整体倾向**: {sent.get('emoji', '')} {sent.get('overall', 'N/A')}")
-        report.append(f"- **新闻数量**: {sentiment.get('total_news', 0)}条")
-        report.append("")
-
-        if sent.get("breakdown"):
-            breakdown = sent["breakdown"]
-            report.append("### 情感分布")
-            report.append(f"- 正面: {breakdown.get('positive', 'N/A')}")
-            report.append(f"- 中性: {breakdown.get('neutral', 'N/A')}")
-            report.append(f"- 负面: {breakdown.get('negative', 'N/A')}")
-            report.append("")
+    if sentiment_ok:
+        sent = sentiment.get("sentiment_summary", {}).get
+        yield f"""- **舆情评分**: {sent('score', 50)}/100
+- **整体倾向**: {sent('emoji', '')} {sent('overall', 'N/A')}
+- **新闻数量**: {sentiment.get('total_news', 0)}条
+
+"""
+
+        sent_breakdown = sent("breakdown")
+        if sent_breakdown:
+            breakdown = sent_breakdown.get
+            yield f"""### 情感分布
+- 正面: {breakdown('positive', 'N/A')}
+- 中性: {breakdown('neutral', 'N/A')}
+- 负面: {breakdown('negative', 'N/A')}
+
+"""
 
         if sentiment.get("positive_headlines"):
-            report.append("### 正面报道")
-            for h in sentiment["positive_headlines"][:3]:
-                report.append(f"- {h}")
-            report.append("")
+            rows = "".join(f"- {h}\n" for h in sentiment["positive_headlines"][:3])
+            yield f"### 正面报道\n{rows}\n"
 
         if sentiment.get("negative_headlines"):
-            report.append("### 负面报道")
-            for h in sentiment["negative_headlines"][:3]:
-                report.append(f"- {h}")
+            rows = "".join(f"- {h}\n" for h in sentiment["negative_headlines"][:3])
+            yield f"### 负面报道\n{rows}"
     else:
-        report.append("*舆情数据不可用*")
-    report.append("")
+        yield "*舆情数据不可用*\n"
+    yield "\n"
 
     # 8. 风险评估
-    report.append("---")
-    report.append("## 8. 风险评估")
-    report.append("")
+    yield "---\n## 8. 风险评估\n\n"
 
-    if risk.get("status") == "success":
-        report.append(f"- **风险等级**: {risk.get('risk_level', 'N/A')}")
-        report.append(f"- **风险评分**: {risk.get('overall_score', 50)}/100")
-        report.append("")
+    if risk_ok:
+        breakdown = risk.get("risk_breakdown", {}).get
+        yield f"""- **风险等级**: {risk.get('risk_level', 'N/A')}
+- **风险评分**: {risk.get('overall_score', 50)}/100
 
-        breakdown = risk.get("risk_breakdown", {})
-        report.append("### 风险分布")
-        report.append(f"- 法律风险: {breakdown.get('legal', 0)}/100")
-        report.append(f"- 财务风险: {breakdown.get('financial', 0)}/100")
-        report.append(f"- 声誉风险: {breakdown.get('reputation', 0)}/100")
-        report.append("")
+### 风险分布
+- 法律风险: {breakdown('legal', 0)}/100
+- 财务风险: {breakdown('financial', 0)}/100
+- 声誉风险: {breakdown('reputation', 0)}/100
+
+"""
 
         if risk.get("top_risks"):
-            report.append("### 主要风险项")
-            for r in risk["top_risks"]:
-                severity_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(r.get("severity", ""), "")
-                report.append(f"- {severity_emoji} **{r.get('type', '')}**: {r.get('description', '')}")
+            rows = "".join(
+                f"- {_SEVERITY_EMOJI.get(r.get('severity', ''), '')} **{r.get('type', '')}**: {r.get('description', '')}\n"
+                for r in risk["top_risks"]
+            )
+            yield f"### 主要风险项\n{rows}"
     else:
-        report.append("*风险数据不可用*")
-    report.append("")
-
-    # 9. 投资建议
-    report.append("---")
-    report.append("## 9. 投资建议")
-    report.append("")
-    report.append(f"**综合评分**: {overall_score:.0f}/100")
-    report.append(f"**总体评价**: {verdict}")
-    report.append("")
-    report.append("### 优势")
-    report.append("- [基于分析自动生成]")
-    report.append("")
-    report.append("### 风险")
-    report.append("- [基于分析自动生成]")
-    report.append("")
-    report.append("### 建议下一步")
-    report.append("1. 安排与管理层深度交流")
-    report.append("2. 获取详细财务数据进行审计")
-    report.append("3. 进行客户/用户访谈")
-    report.append("4. 聘请专业机构进行法律尽调")
-    report.append("5. 评估行业竞争格局")
-    report.append("")
-
-    # 10. 附录
-    report.append("---")
-    report.append("## 10. 附录")
-    report.append("")
-    report.append("### 数据来源")
-    report.append("- 公开市场数据 (yfinance)")
-    report.append("- 模拟融资/招聘/新闻数据")
-    report.append("- 实际应用建议对接: 天眼查、Crunchbase、LinkedIn等API")
-    report.append("")
-    report.append("### 免责声明")
-    report.append("本报告基于公开信息生成，仅供参考，不构成投资建议。")
-    report.append("投资决策前请进行独立的尽职调查。")
-    report.append("")
-    report.append("=" * 70)
-
-    return "\n".join(report)
+        yield "*风险数据不可用*\n"
+    yield "\n"
+
+    # 9. 投资建议 + 10. 附录
+    yield _FULL_CLOSING_TEMPLATE.format(overall_score=overall_score, verdict=verdict)
 
 
 def compare_companies(company_names: List[str]) -> str:
@@ -534,20 +696,24 @@ def compare_companies(company_names: List[str]) -> str:
     Returns:
         对比报告（Markdown格式）
     """
-    report = []
-    report.append("=" * 60)
-    report.append("# 📊 企业对比分析报告")
-    report.append(f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    report.append("=" * 60)
-    report.append("")
-
-    # 收集各公司数据
+    generated_at = datetime.now().strftime(_REPORT_TS_FMT)
+
+    # 收集各公司数据：所有公司 × 数据源一次性提交到同一个线程池
+    jobs = [(name, key) for name in company_names for key in COMPARE_SOURCES]
+    by_company = {name: {} for name in company_names}
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as executor:
+            futures = [(name, key, executor.submit(DATA_SOURCES[key], name)) for name, key in jobs]
+        for name, key, future in futures:
+            by_company[name][key] = future.result()
+
     company_data = []
     for name in company_names:
-        profile = get_company_profile(name)
-        risk = get_risk_score(name)
-        growth = analyze_growth_signals(name)
-        funding = analyze_funding_trajectory(name)
+        fetched = by_company[name]
+        profile = fetched["profile"]
+        risk = fetched["risk"]
+        growth = fetched["growth"]
+        funding = fetched["funding"]
 
         if profile.get("status") == "success":
             company_data.append({
@@ -563,64 +729,49 @@ def compare_companies(company_names: List[str]) -> str:
         return "未能获取任何公司的数据"
 
     # 对比表格
-    report.append("## 基本信息对比")
-    report.append("")
-    report.append("| 指标 | " + " | ".join([d["name"] for d in company_data]) + " |")
-    report.append("|------" + "|------" * len(company_data) + "|")
-
-    # 行业
-    industries = []
-    for d in company_data:
-        data = d["profile"].get("data", {})
-        industries.append(data.get("industry", "N/A"))
-    report.append("| 行业 | " + " | ".join(industries) + " |")
-
-    # 估值/市值
-    valuations = []
-    for d in company_data:
-        data = d["profile"].get("data", {})
-        if d["profile"].get("is_public"):
-            valuations.append(data.get("market_cap_formatted", "N/A"))
-        else:
-            valuations.append(data.get("valuation", "N/A"))
-    report.append("| 估值/市值 | " + " | ".join(valuations) + " |")
-
-    # 风险评分
-    risks = []
-    for d in company_data:
-        if d["risk"].get("status") == "success":
-            risks.append(f"{d['risk'].get('overall_score', 'N/A')}/100")
-        else:
-            risks.append("N/A")
-    report.append("| 风险评分 | " + " | ".join(risks) + " |")
-
-    # 增长信号
-    growths = []
-    for d in company_data:
-        if d["growth"].get("status") == "success":
-            growths.append(d["growth"].get("overall_assessment", {}).get("signal", "N/A"))
-        else:
-            growths.append("N/A")
-    report.append("| 增长信号 | " + " | ".join(growths) + " |")
-
-    # 综合评分
-    scores = []
-    for d in company_data:
-        scores.append(f"{d['score']:.0f}/100")
-    report.append("| 综合评分 | " + " | ".join(scores) + " |")
-
-    report.append("")
+    names = " | ".join(d["name"] for d in company_data)
+    industries = " | ".join(d["profile"].get("data", {}).get("industry", "N/A") for d in company_data)
+    valuations = " | ".join(
+        d["profile"].get("data", {}).get("market_cap_formatted" if d["profile"].get("is_public") else "valuation", "N/A")
+        for d in company_data
+    )
+    risks = " | ".join(
+        f"{d['risk'].get('overall_score', 'N/A')}/100" if d["risk"].get("status") == "success" else "N/A"
+        for d in company_data
+    )
+    growths = " | ".join(
+        d["growth"].get("overall_assessment", {}).get("signal", "N/A") if d["growth"].get("status") == "success" else "N/A"
+        for d in company_data
+    )
+    scores = " | ".join(f"{d['score']:.0f}/100" for d in company_data)
 
     # 排名
-    report.append("## 综合排名")
-    report.append("")
     ranked = sorted(company_data, key=lambda x: x["score"], reverse=True)
-    for i, d in enumerate(ranked, 1):
-        medal = ["🥇", "🥈", "🥉"][i-1] if i <= 3 else f"{i}."
-        report.append(f"{medal} **{d['name']}** - {d['score']:.0f}分")
-
-    report.append("")
-    report.append("---")
-    report.append("*此报告基于公开信息生成，仅供参考*")
-
-    return "\n".join(report)
+    ranking = "".join(
+        f"{_MEDALS[i-1] if i <= len(_MEDALS) else f'{i}.'} **{d['name']}** - {d['score']:.0f}分\n"
+        for i, d in enumerate(ranked, 1)
+    )
+
+    buf = io.StringIO()
+    buf.write(f"""{"=" * 60}
+# 📊 企业对比分析报告
+生成时间: {generated_at}
+{"=" * 60}
+
+## 基本信息对比
+
+| 指标 | {names} |
+|------{"|------" * len(company_data)}|
+| 行业 | {industries} |
+| 估值/市值 | {valuations} |
+| 风险评分 | {risks} |
+| 增长信号 | {growths} |
+| 综合评分 | {scores} |
+
+## 综合排名
+
+{ranking}
+---
+*此报告基于公开信息生成，仅供参考*""")
+
+    return buf.getvalue()
@@ -3,9 +3,14 @@ Funding Analyzer Module - 融资分析模块
 分析企业融资历史、估值轨迹、投资人信息
 """
 
-from typing import Dict, List, Optional
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-import random
+from functools import lru_cache
+
+# 共享的空序列默认值（避免每次调用新建空列表）
+_EMPTY: Tuple = ()
 
 # 模拟融资数据库（实际应用中可对接天眼查、Crunchbase等API）
 FUNDING_DATABASE = {
@@ -98,10 +103,99 @@ INVESTOR_DATABASE = {
     }
 }
 
+def _classify_investor(inv_type: str) -> str:
+    """将投资机构类型归入 VC / PE / Strategic / Other"""
+    if "VC" in inv_type:
+        return "VC"
+    elif "PE" in inv_type:
+        return "PE"
+    elif "Strategic" in inv_type:
+        return "Strategic"
+    return "Other"
+
+
+# 投资机构名称 -> 类型分类（模块加载时计算一次）
+_INVESTOR_CLASS = {
+    name: _classify_investor(data.get("type", "Other"))
+    for name, data in INVESTOR_DATABASE.items()
+}
+
+# 融资轮次关键词 -> 发展阶段（按匹配优先级排列）
+_STAGE_MAP = {
+    "seed": "种子期",
+    "angel": "种子期",
+    "series a": "早期",
+    "series b": "成长期",
+    "series c": "成长期",
+    "series d": "扩张期",
+    "series e": "扩张期",
+    "pre-ipo": "Pre-IPO",
+    "series f": "Pre-IPO",
+}
+
+# 由 _STAGE_MAP 关键词拼成的单个正则，一次扫描即可定位轮次关键词
+_STAGE_RE = re.compile("|".join(map(re.escape, _STAGE_MAP)))
+
+
+def _parse_round_date(date_str: Optional[str]) -> Optional[int]:
+    """将 "YYYY-MM" 格式的融资日期解析为日序数，无法解析时返回 None"""
+    try:
+        return datetime.strptime(date_str, "%Y-%m").toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+# 各公司融资轮次日期的日序数（与 funding_rounds 一一对应，模块加载时解析一次）
+_ROUND_DAYS = {
+    key: tuple(_parse_round_date(r.get("date")) for r in data["funding_rounds"])
+    for key, data in FUNDING_DATABASE.items()
+}
+
+
+def _round_intervals(days: Tuple[Optional[int], ...]) -> Tuple[float, ...]:
+    """相邻两轮融资之间的间隔（月），跳过无法解析的日期"""
+    return tuple(
+        (newer - older) / 30
+        for newer, older in zip(days, days[1:])
+        if newer is not None and older is not None
+    )
+
+
+# 各公司相邻融资轮次的间隔（月）
+_ROUND_INTERVALS = {key: _round_intervals(days) for key, days in _ROUND_DAYS.items()}
+
+# 预先计算的 (原始键, 小写键)，查询时无需对每个键重复调用 lower()
+_FUNDING_KEYS_LOWER = [(key, key.lower()) for key in FUNDING_DATABASE]
+
+# 公司别名 -> 融资数据库键（小写），精确命中时无需子串扫描
+_FUNDING_ALIAS = {
+    **{key_lower: key for key, key_lower in _FUNDING_KEYS_LOWER},
+    "bytedance": "字节跳动",
+    "tiktok": "字节跳动",
+    "抖音": "字节跳动",
+    "open ai": "openai",
+    "chatgpt": "openai",
+    "claude": "anthropic",
+    "space x": "spacex",
+}
+
+# 预先计算的 (机构名, 小写名, 小写英文名, 数据)，供投资机构模糊匹配使用
+_INVESTOR_LC = [
+    (name, name.lower(), data.get("name_en", "").lower(), data)
+    for name, data in INVESTOR_DATABASE.items()
+]
 
+# 估值字符串解析（单位：十亿美元）
+_VALUATION_RE = re.compile(r"\$?(\d+(?:\.\d+)?)\s*B")
+
+# 各估值方法相对最新融资估值的溢价系数（模拟值，未列出的方法按 1.0 处理）
+_VALUATION_PREMIUM = {"comparable": 1.05, "dcf": 1.00}
+
+
+@lru_cache(maxsize=512)
 def get_funding_history(company_name: str) -> Dict:
     """
-    获取公司融资历史
+    获取公司融资历史（结果会被缓存并在调用间共享，请勿修改返回值）
 
     Args:
         company_name: 公司名称
@@ -109,20 +203,28 @@ def get_funding_history(company_name: str) -> Dict:
     Returns:
         融资历史信息
     """
-    name_lower = company_name.lower()
-
-    # 查找匹配的公司
-    for key, data in FUNDING_DATABASE.items():
-        if name_lower in key.lower() or key.lower() in name_lower:
-            return {
-                "status": "success",
-                "company": key,
-                "total_raised": data["total_raised"],
-                "latest_valuation": data["latest_valuation"],
-                "round_count": len(data["funding_rounds"]),
-                "funding_rounds": data["funding_rounds"],
-                "data_source": "模拟数据 (可对接天眼查/Crunchbase API)"
-            }
+    name_lower = company_name.lower().strip()
+
+    # 别名直接匹配，未命中再按子串查找
+    key = _FUNDING_ALIAS.get(name_lower)
+    if key is None:
+        key = next(
+            (key for key, key_lower in _FUNDING_KEYS_LOWER
+             if name_lower in key_lower or key_lower in name_lower),
+            None
+        )
+
+    if key is not None:
+        data = FUNDING_DATABASE[key]
+        return {
+            "status": "success",
+            "company": key,
+            "total_raised": data["total_raised"],
+            "latest_valuation": data["latest_valuation"],
+            "round_count": len(data["funding_rounds"]),
+            "funding_rounds": data["funding_rounds"],
+            "data_source": "模拟数据 (可对接天眼查/Crunchbase API)"
+        }
 
     return {
         "status": "not_found",
@@ -133,7 +235,7 @@ def get_funding_history(company_name: str) -> Dict:
 
 def analyze_funding_trajectory(company_name: str) -> Dict:
     """
-    分析融资轨迹和趋势
+    分析融资轨迹和趋势（结果在调用间共享，请勿修改返回值）
 
     Args:
         company_name: 公司名称
@@ -146,25 +248,19 @@ def analyze_funding_trajectory(company_name: str) -> Dict:
     if history.get("status") != "success":
         return history
 
-    rounds = history["funding_rounds"]
+    return _ANALYSIS_CACHE_FUNDING[history["company"]]
 
-    # 分析融资间隔
-    intervals = []
-    for i in range(len(rounds) - 1):
-        try:
-            date1 = datetime.strptime(rounds[i]["date"], "%Y-%m")
-            date2 = datetime.strptime(rounds[i+1]["date"], "%Y-%m")
-            interval = (date1 - date2).days / 30  # 月数
-            intervals.append(interval)
-        except:
-            pass
 
+def _analyze_trajectory(history: Dict) -> Dict:
+    """由融资历史生成融资轨迹分析"""
+    rounds = history["funding_rounds"]
+
+    # 分析融资间隔（已在模块加载时计算）
+    intervals = _ROUND_INTERVALS[history["company"]]
     avg_interval = sum(intervals) / len(intervals) if intervals else 0
 
-    # 分析投资人类型
-    all_investors = []
-    for r in rounds:
-        all_investors.extend(r.get("investors", []))
+    # 分析投资人类型（单次遍历统计各投资人出现轮次，后续分析共用）
+    investor_counts = Counter(inv for r in rounds for inv in r.get("investors", _EMPTY))
 
     investor_types = {
         "VC": 0,
@@ -172,20 +268,7 @@ def analyze_funding_trajectory(company_name: str) -> Dict:
         "Strategic": 0,
         "Other": 0
     }
-
-    for inv in set(all_investors):
-        if inv in INVESTOR_DATABASE:
-            inv_type = INVESTOR_DATABASE[inv].get("type", "Other")
-            if "VC" in inv_type:
-                investor_types["VC"] += 1
-            elif "PE" in inv_type:
-                investor_types["PE"] += 1
-            elif "Strategic" in inv_type:
-                investor_types["Strategic"] += 1
-            else:
-                investor_types["Other"] += 1
-        else:
-            investor_types["Other"] += 1
+    investor_types.update(Counter(_INVESTOR_CLASS.get(inv, "Other") for inv in investor_counts))
 
     # 融资阶段分析
     latest_round = rounds[0] if rounds else {}
@@ -208,9 +291,9 @@ def analyze_funding_trajectory(company_name: str) -> Dict:
             "growth_signal": "强" if len(rounds) > 4 and avg_interval < 18 else "中" if len(rounds) > 2 else "弱"
         },
         "investor_mix": investor_types,
-        "unique_investors": len(set(all_investors)),
-        "repeat_investors": find_repeat_investors(rounds),
-        "notable_investors": [inv for inv in set(all_investors) if inv in INVESTOR_DATABASE][:5]
+        "unique_investors": len(investor_counts),
+        "repeat_investors": find_repeat_investors(investor_counts),
+        "notable_investors": [inv for inv in investor_counts if inv in INVESTOR_DATABASE][:5]
     }
 
     return analysis
@@ -218,34 +301,25 @@ def analyze_funding_trajectory(company_name: str) -> Dict:
 
 def get_company_stage(round_name: str) -> str:
     """判断公司所处阶段"""
-    round_lower = round_name.lower()
-    if "seed" in round_lower or "angel" in round_lower:
-        return "种子期"
-    elif "series a" in round_lower:
-        return "早期"
-    elif "series b" in round_lower or "series c" in round_lower:
-        return "成长期"
-    elif "series d" in round_lower or "series e" in round_lower:
-        return "扩张期"
-    elif "pre-ipo" in round_lower or "series f" in round_lower:
-        return "Pre-IPO"
-    else:
-        return "成熟期"
+    match = _STAGE_RE.search(round_name.lower())
+    return _STAGE_MAP[match.group()] if match else "成熟期"
+
 
+def find_repeat_investors(investor_counts: Counter) -> List[str]:
+    """找出多轮投资的投资人（investor_counts: 投资人 -> 参与轮次数）"""
+    return [inv for inv, count in investor_counts.items() if count > 1]
 
-def find_repeat_investors(rounds: List[Dict]) -> List[str]:
-    """找出多轮投资的投资人"""
-    investor_count = {}
-    for r in rounds:
-        for inv in r.get("investors", []):
-            investor_count[inv] = investor_count.get(inv, 0) + 1
 
-    return [inv for inv, count in investor_count.items() if count > 1]
+# 各公司融资轨迹分析（数据静态，模块加载时生成一次）
+_ANALYSIS_CACHE_FUNDING = {
+    key: _analyze_trajectory(get_funding_history(key)) for key in FUNDING_DATABASE
+}
 
 
+@lru_cache(maxsize=512)
 def get_investor_info(investor_name: str) -> Dict:
     """
-    获取投资机构信息
+    获取投资机构信息（结果会被缓存并在调用间共享，请勿修改返回值）
 
     Args:
         investor_name: 投资机构名称
@@ -262,24 +336,24 @@ def get_investor_info(investor_name: str) -> Dict:
             "name_en": data.get("name_en", ""),
             "type": data.get("type", "N/A"),
             "aum": data.get("aum", "N/A"),
-            "focus_areas": data.get("focus", []),
-            "notable_investments": data.get("notable_investments", []),
-            "stage_preference": data.get("stage_preference", [])
+            "focus_areas": data.get("focus", _EMPTY),
+            "notable_investments": data.get("notable_investments", _EMPTY),
+            "stage_preference": data.get("stage_preference", _EMPTY)
         }
 
     # 模糊匹配
     name_lower = investor_name.lower()
-    for key, data in INVESTOR_DATABASE.items():
-        if name_lower in key.lower() or name_lower in data.get("name_en", "").lower():
+    for key, key_lower, name_en_lower, data in _INVESTOR_LC:
+        if name_lower in key_lower or name_lower in name_en_lower:
             return {
                 "status": "success",
                 "name": key,
                 "name_en": data.get("name_en", ""),
                 "type": data.get("type", "N/A"),
                 "aum": data.get("aum", "N/A"),
-                "focus_areas": data.get("focus", []),
-                "notable_investments": data.get("notable_investments", []),
-                "stage_preference": data.get("stage_preference", [])
+                "focus_areas": data.get("focus", _EMPTY),
+                "notable_investments": data.get("notable_investments", _EMPTY),
+                "stage_preference": data.get("stage_preference", _EMPTY)
             }
 
     return {
@@ -288,9 +362,10 @@ def get_investor_info(investor_name: str) -> Dict:
     }
 
 
+@lru_cache(maxsize=512)
 def estimate_valuation(company_name: str, method: str = "comparable") -> Dict:
     """
-    估算公司估值
+    估算公司估值（结果会被缓存并在调用间共享，请勿修改返回值）
 
     Args:
         company_name: 公司名称
@@ -309,27 +384,20 @@ def estimate_valuation(company_name: str, method: str = "comparable") -> Dict:
 
     latest_val = history.get("latest_valuation", "$0")
 
-    # 解析估值
-    try:
-        val_str = latest_val.replace("$", "").replace("B", "")
-        base_val = float(val_str.split()[0]) * 1e9
-    except:
-        base_val = 0
+    # 解析估值（形如 "$157B"，无法识别时按 0 处理）
+    match = _VALUATION_RE.match(latest_val)
+    base_val = float(match.group(1)) * 1e9 if match else 0
 
     # 不同估值方法
+    estimated = base_val * _VALUATION_PREMIUM.get(method, 1.0)
     if method == "comparable":
         # 可比公司法（模拟）
-        premium = random.uniform(0.9, 1.2)
-        estimated = base_val * premium
         confidence = "中等"
     elif method == "dcf":
         # DCF法（模拟）
-        premium = random.uniform(0.85, 1.15)
-        estimated = base_val * premium
         confidence = "低（需要财务数据）"
     else:
         # 基于最新融资
-        estimated = base_val
         confidence = "高（基于最新融资）"
 
     return {
@@ -3,8 +3,17 @@ Hiring Tracker Module - 招聘追踪模块
 追踪企业招聘活动，分析增长信号
 """
 
-from typing import Dict, List, Optional
+import time
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+# 共享的空序列默认值（避免每次调用新建空列表）
+_EMPTY: Tuple = ()
 
 # 模拟招聘数据库
 HIRING_DATABASE = {
@@ -113,21 +122,126 @@ HIRING_DATABASE = {
     }
 }
 
+# 预先计算的 (原始键, 小写键)，查询时无需对每个键重复调用 lower()
+_HIRING_KEYS_LOWER = [(key, key.lower()) for key in HIRING_DATABASE]
+
+# 各公司部门数据按列存放（名称 / 增长率，与数据库中的部门顺序一致，模块加载时提取一次）
+_DEPT_NAMES = {key: tuple(data["departments"]) for key, data in HIRING_DATABASE.items()}
+_DEPT_GROWTH = {
+    key: tuple(info.get("growth", 0) for info in data["departments"].values())
+    for key, data in HIRING_DATABASE.items()
+}
+
+# 部门增长信号档位：增长率超过第 i 个阈值即升至第 i+1 档（阈值升序）
+_DEPT_SIGNAL_THRESHOLDS = (-10, 0, 20, 50)
+_DEPT_SIGNAL_TIERS = (
+    ("🔴 {dept}: 大幅收缩 ({growth}%)", "业务收缩或重组"),
+    ("⚠️ {dept}: 轻微收缩 ({growth}%)", "优化调整中"),
+    ("➡️ {dept}: 平稳发展 (+{growth}%)", "正常补充"),
+    ("📈 {dept}: 稳健增长 (+{growth}%)", "业务发展良好"),
+    ("🔥 {dept}: 快速扩张 (+{growth}%)", "战略重点领域"),
+)
+
+# 综合增长信号档位：平均增长率超过第 i 个阈值即升至第 i+1 档（阈值升序）
+_GROWTH_THRESHOLDS = (-10, 0, 10, 30)
+_GROWTH_TIERS = (
+    ("收缩信号", "公司可能面临挑战，需谨慎评估", 15),
+    ("谨慎信号", "公司可能在优化调整，需关注", 30),
+    ("稳定信号", "业务稳定，无明显扩张迹象", 50),
+    ("正增长信号", "公司处于健康发展期", 70),
+    ("强增长信号", "建议密切关注，可能是合作/投资好时机", 90),
+)
+
+
+def _classify_growth(growth_rates: Tuple[int, ...]) -> Tuple[float, Tuple[str, str, int]]:
+    """计算平均增长率并映射到 (信号, 建议, 得分) 档位"""
+    avg_growth = sum(growth_rates) / len(growth_rates)
+    return avg_growth, _GROWTH_TIERS[bisect_left(_GROWTH_THRESHOLDS, avg_growth)]
+
+
+def _dept_order(departments: Dict, field: str) -> Tuple[str, ...]:
+    """按部门指标（growth/count）降序排列部门名称，指标相同保持原顺序"""
+    return tuple(sorted(departments, key=lambda dept: departments[dept].get(field, 0), reverse=True))
+
+
+# 各公司部门展示顺序（按增长率 / 岗位数降序，模块加载时排好）
+_DEPT_ORDER_BY_GROWTH = {key: _dept_order(data["departments"], "growth") for key, data in HIRING_DATABASE.items()}
+_DEPT_ORDER_BY_OPENINGS = {key: _dept_order(data["departments"], "count") for key, data in HIRING_DATABASE.items()}
+
+
+def _build_breakdown(key: str, data: Dict) -> Tuple[Dict, ...]:
+    """按岗位数降序生成部门招聘明细（百分比、增长率等文本提前格式化）"""
+    total = data["total_openings"]
+    departments = data["departments"]
+    breakdown = []
+    for dept in _DEPT_ORDER_BY_OPENINGS[key]:
+        info = departments[dept]
+        count = info.get("count", 0)
+        percentage = (count / total * 100) if total else 0
+        breakdown.append({
+            "department": dept,
+            "openings": count,
+            "percentage": f"{percentage:.1f}%",
+            "growth_rate": f"{info.get('growth', 0):+d}%",
+            "hot_roles": info.get("hot_roles", _EMPTY)
+        })
+    return tuple(breakdown)
+
+
+# 各公司部门招聘明细（数据静态，模块加载时生成一次；返回前逐行复制）
+_HIRING_BREAKDOWN_CACHE = {key: _build_breakdown(key, data) for key, data in HIRING_DATABASE.items()}
+
+
+# 当天日期字符串缓存：[上次刷新时刻（monotonic 秒）, "YYYY-MM-DD"]
+_TODAY_TTL = 60
+_today_cache = [float("-inf"), ""]
+
 
-def get_hiring_activity(company_name: str) -> Dict:
+def _today() -> str:
+    """返回当天日期字符串（最多每 60 秒重新格式化一次，跨零点时可能延迟至多 60 秒）"""
+    now = time.monotonic()
+    if now - _today_cache[0] > _TODAY_TTL:
+        _today_cache[0] = now
+        _today_cache[1] = datetime.now().strftime("%Y-%m-%d")
+    return _today_cache[1]
+
+
+def get_hiring_activity(company_name: str) -> Mapping:
     """
     获取公司招聘活动概况
 
+    返回只读映射（MappingProxyType），同一天内的相同查询共享同一对象；
+    需要修改或 JSON 序列化时请先 dict(...) 复制。
+
     Args:
         company_name: 公司名称
 
     Returns:
         招聘活动信息
     """
-    name_lower = company_name.lower()
+    return _hiring_response(company_name, _today())
+
+
+@lru_cache(maxsize=512)
+def _hiring_response(company_name: str, today: str) -> Mapping:
+    """按 (公司名称, 日期) 组装并冻结招聘概况响应"""
+    activity = _find_hiring_activity(company_name.lower())
+
+    if activity is None:
+        return MappingProxyType({
+            "status": "not_found",
+            "message": f"未找到 {company_name} 的招聘信息"
+        })
 
-    for key, data in HIRING_DATABASE.items():
-        if name_lower in key.lower() or key.lower() in name_lower:
+    return MappingProxyType({**activity, "last_updated": today})
+
+
+@lru_cache(maxsize=512)
+def _find_hiring_activity(name_lower: str) -> Optional[Dict]:
+    """按小写名称查找并组装招聘概况（不含日期；结果被缓存共享，请勿修改）"""
+    for key, key_lower in _HIRING_KEYS_LOWER:
+        if name_lower in key_lower or key_lower in name_lower:
+            data = HIRING_DATABASE[key]
             return {
                 "status": "success",
                 "company": key,
@@ -139,97 +253,62 @@ def get_hiring_activity(company_name: str) -> Dict:
                 "departments": data["departments"],
                 "locations": data["locations"],
                 "salary_ranges": data["salary_range"],
-                "key_hires": data.get("key_hires_2024", []),
-                "data_source": "模拟数据 (可对接LinkedIn/Boss直聘 API)",
-                "last_updated": datetime.now().strftime("%Y-%m-%d")
+                "key_hires": data.get("key_hires_2024", _EMPTY),
+                "data_source": "模拟数据 (可对接LinkedIn/Boss直聘 API)"
             }
 
-    return {
-        "status": "not_found",
-        "message": f"未找到 {company_name} 的招聘信息"
-    }
+    return None
 
 
-def analyze_growth_signals(company_name: str) -> Dict:
-    """
-    分析招聘背后的增长信号
+@dataclass
+class DeptSignal:
+    """单个部门的招聘增长信号（内部使用，对外输出前经 to_dict 转为字典）"""
+    __slots__ = ("department", "signal", "growth_rate", "interpretation", "hot_roles")
 
-    Args:
-        company_name: 公司名称
+    department: str
+    signal: str
+    growth_rate: int
+    interpretation: str
+    hot_roles: Sequence[str]
 
-    Returns:
-        增长信号分析
-    """
-    hiring = get_hiring_activity(company_name)
+    def to_dict(self) -> Dict:
+        """转换为对外返回的字典格式"""
+        return {
+            "department": self.department,
+            "signal": self.signal,
+            "growth_rate": self.growth_rate,
+            "interpretation": self.interpretation,
+            "hot_roles": self.hot_roles
+        }
 
-    if hiring.get("status") != "success":
-        return hiring
 
+def _build_growth_signals(hiring: Dict) -> Dict:
+    """由招聘概况生成增长信号分析（不含分析日期）"""
+    key = hiring["company"]
     snapshot = hiring["snapshot"]
     departments = hiring["departments"]
 
-    # 分析各部门增长
+    # 分析各部门增长（按增长率降序）
     dept_signals = []
-    for dept, info in departments.items():
+    for dept in _DEPT_ORDER_BY_GROWTH[key]:
+        info = departments[dept]
         growth = info.get("growth", 0)
-        if growth > 50:
-            signal = f"🔥 {dept}: 快速扩张 (+{growth}%)"
-            interpretation = "战略重点领域"
-        elif growth > 20:
-            signal = f"📈 {dept}: 稳健增长 (+{growth}%)"
-            interpretation = "业务发展良好"
-        elif growth > 0:
-            signal = f"➡️ {dept}: 平稳发展 (+{growth}%)"
-            interpretation = "正常补充"
-        elif growth > -10:
-            signal = f"⚠️ {dept}: 轻微收缩 ({growth}%)"
-            interpretation = "优化调整中"
-        else:
-            signal = f"🔴 {dept}: 大幅收缩 ({growth}%)"
-            interpretation = "业务收缩或重组"
-
-        dept_signals.append({
-            "department": dept,
-            "signal": signal,
-            "growth_rate": growth,
-            "interpretation": interpretation,
-            "hot_roles": info.get("hot_roles", [])
-        })
+        template, interpretation = _DEPT_SIGNAL_TIERS[bisect_left(_DEPT_SIGNAL_THRESHOLDS, growth)]
+        dept_signals.append(DeptSignal(
+            dept, template.format(dept=dept, growth=growth), growth, interpretation,
+            info.get("hot_roles", _EMPTY)
+        ))
 
     # 计算综合信号强度
-    avg_growth = sum(d.get("growth", 0) for d in departments.values()) / len(departments)
+    avg_growth, (overall_signal, recommendation, score) = _classify_growth(_DEPT_GROWTH[key])
     total_growth = snapshot.get("yoy_growth", "0%")
 
-    if avg_growth > 30:
-        overall_signal = "强增长信号"
-        recommendation = "建议密切关注，可能是合作/投资好时机"
-        score = 90
-    elif avg_growth > 10:
-        overall_signal = "正增长信号"
-        recommendation = "公司处于健康发展期"
-        score = 70
-    elif avg_growth > 0:
-        overall_signal = "稳定信号"
-        recommendation = "业务稳定，无明显扩张迹象"
-        score = 50
-    elif avg_growth > -10:
-        overall_signal = "谨慎信号"
-        recommendation = "公司可能在优化调整，需关注"
-        score = 30
-    else:
-        overall_signal = "收缩信号"
-        recommendation = "公司可能面临挑战，需谨慎评估"
-        score = 15
-
     # 识别战略重点
-    strategic_focus = []
-    for dept, info in departments.items():
-        if info.get("growth", 0) > 30:
-            strategic_focus.append(dept)
+    strategic_focus = [dept for dept, growth in zip(_DEPT_NAMES[key], _DEPT_GROWTH[key]) if growth > 30]
 
     return {
         "status": "success",
-        "company": hiring["company"],
+        "company": key,
         "overall_assessment": {
             "signal": overall_signal,
             "score": score,
@@ -238,9 +317,36 @@ def analyze_growth_signals(company_name: str) -> Dict:
             "recommendation": recommendation
         },
         "strategic_focus": strategic_focus if strategic_focus else ["未发现明显战略重点"],
-        "department_signals": sorted(dept_signals, key=lambda x: x["growth_rate"], reverse=True),
-        "key_hires": hiring.get("key_hires", []),
-        "analysis_date": datetime.now().strftime("%Y-%m-%d")
+        "department_signals": [signal.to_dict() for signal in dept_signals],
+        "key_hires": hiring.get("key_hires", _EMPTY)
+    }
+
+
+# 各公司增长信号分析（数据静态，模块加载时生成一次；调用时仅补充分析日期）
+_GROWTH_SIGNALS_CACHE = {
+    key: _build_growth_signals(_find_hiring_activity(key_lower))
+    for key, key_lower in _HIRING_KEYS_LOWER
+}
+
+
+def analyze_growth_signals(company_name: str) -> Dict:
+    """
+    分析招聘背后的增长信号（嵌套结构在调用间共享，请勿修改返回值）
+
+    Args:
+        company_name: 公司名称
+
+    Returns:
+        增长信号分析
+    """
+    hiring = get_hiring_activity(company_name)
+
+    if hiring.get("status") != "success":
+        return dict(hiring)
+
+    return {
+        **_GROWTH_SIGNALS_CACHE[hiring["company"]],
+        "analysis_date": _today()
     }
 
 
@@ -257,34 +363,46 @@ def get_department_breakdown(company_name: str) -> Dict:
     hiring = get_hiring_activity(company_name)
 
     if hiring.get("status") != "success":
-        return hiring
+        return dict(hiring)
 
-    departments = hiring["departments"]
-    total = hiring["snapshot"]["total_openings"]
+    company = hiring["company"]
+
+    return {
+        "status": "success",
+        "company": company,
+        "total_openings": hiring["snapshot"]["total_openings"],
+        "department_breakdown": [dict(row) for row in _HIRING_BREAKDOWN_CACHE[company]]
+    }
 
-    breakdown = []
-    for dept, info in departments.items():
-        count = info.get("count", 0)
-        percentage = (count / total * 100) if total else 0
-        breakdown.append({
-            "department": dept,
-            "openings": count,
-            "percentage": f"{percentage:.1f}%",
-            "growth_rate": f"{info.get('growth', 0):+d}%",
-            "hot_roles": info.get("hot_roles", [])
-        })
+
+def _build_key_hires(hiring: Dict) -> Dict:
+    """由招聘概况生成关键人才变动分析"""
+    key_hires = hiring.get("key_hires", _EMPTY)
+
+    # 分析人才来源
+    sources = dict(Counter(hire.get("from", "Unknown") for hire in key_hires))
 
     return {
         "status": "success",
         "company": hiring["company"],
-        "total_openings": total,
-        "department_breakdown": sorted(breakdown, key=lambda x: x["openings"], reverse=True)
+        "recent_key_hires": key_hires,
+        "hire_count": len(key_hires),
+        "talent_sources": sources,
+        "signal": "积极" if len(key_hires) > 2 else "正常" if key_hires else "平静",
+        "note": "关键人才引进通常预示新业务方向或战略调整"
     }
 
 
+# 各公司关键人才变动分析（数据静态，模块加载时生成一次）
+_KEY_HIRES_CACHE = {
+    key: _build_key_hires(_find_hiring_activity(key_lower))
+    for key, key_lower in _HIRING_KEYS_LOWER
+}
+
+
 def track_key_hires(company_name: str) -> Dict:
     """
-    追踪关键人才变动
+    追踪关键人才变动（结果在调用间共享，请勿修改返回值）
 
     Args:
         company_name: 公司名称
@@ -295,24 +413,22 @@ def track_key_hires(company_name: str) -> Dict:
     hiring = get_hiring_activity(company_name)
 
     if hiring.get("status") != "success":
-        return hiring
+        return dict(hiring)
 
-    key_hires = hiring.get("key_hires", [])
+    return _KEY_HIRES_CACHE[hiring["company"]]
 
-    # 分析人才来源
-    sources = {}
-    for hire in key_hires:
-        source = hire.get("from", "Unknown")
-        sources[source] = sources.get(source, 0) + 1
 
+def _summary_for_compare(company_key: str) -> Dict:
+    """从预计算的增长信号中提取对比所需字段"""
+    signals = _GROWTH_SIGNALS_CACHE[company_key]
+    assessment = signals["overall_assessment"]
     return {
-        "status": "success",
-        "company": hiring["company"],
-        "recent_key_hires": key_hires,
-        "hire_count": len(key_hires),
-        "talent_sources": sources,
-        "signal": "积极" if len(key_hires) > 2 else "正常" if key_hires else "平静",
-        "note": "关键人才引进通常预示新业务方向或战略调整"
+        "company": company_key,
+        "signal_score": assessment["score"],
+        "signal": assessment["signal"],
+        "total_openings": assessment["total_openings"],
+        "yoy_change": assessment["yoy_change"],
+        "strategic_focus": signals["strategic_focus"]
     }
 
 
@@ -329,16 +445,9 @@ def compare_hiring(companies: List[str]) -> Dict:
     comparisons = []
 
     for company in companies:
-        signals = analyze_growth_signals(company)
-        if signals.get("status") == "success":
-            comparisons.append({
-                "company": signals["company"],
-                "signal_score": signals["overall_assessment"]["score"],
-                "signal": signals["overall_assessment"]["signal"],
-                "total_openings": signals["overall_assessment"]["total_openings"],
-                "yoy_change": signals["overall_assessment"]["yoy_change"],
-                "strategic_focus": signals["strategic_focus"]
-            })
+        activity = _find_hiring_activity(company.lower())
+        if activity is not None:
+            comparisons.append(_summary_for_compare(activity["company"]))
 
     if not comparisons:
         return {
@@ -351,7 +460,7 @@ def compare_hiring(companies: List[str]) -> Dict:
 
     return {
         "status": "success",
-        "comparison_date": datetime.now().strftime("%Y-%m-%d"),
+        "comparison_date": _today(),
         "companies_compared": len(comparisons),
         "ranking": ranked,
         "leader": ranked[0]["company"] if ranked else "N/A",
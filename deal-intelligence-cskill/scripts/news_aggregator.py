@@ -3,8 +3,12 @@ News Aggregator Module - 新闻聚合模块
 聚合公司新闻、行业动态、舆情分析
 """
 
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 import random
 
 # 模拟新闻数据库
@@ -126,10 +130,41 @@ INDUSTRY_NEWS = {
     ]
 }
 
-
+# 小写名称 -> 数据库键的精确索引，以及供子串匹配的 (原始键, 小写键)，模块加载时构建一次
+_NEWS_INDEX = {key.lower(): key for key in NEWS_DATABASE}
+_NEWS_KEYS_LOWER = tuple((key, key.lower()) for key in NEWS_DATABASE)
+_INDUSTRY_INDEX = {key.lower(): key for key in INDUSTRY_NEWS}
+_INDUSTRY_KEYS_LOWER = tuple((key, key.lower()) for key in INDUSTRY_NEWS)
+
+# 情感得分档位：得分达到第 i 个分界即升至第 i+1 档，每档为 (整体情感, 标识, 建议)
+_SENTIMENT_EDGES = (30, 50, 70)
+_SENTIMENT_TIERS = (
+    ("消极", "🔴", "负面舆论较多，需谨慎评估风险"),
+    ("中性偏消极", "🟠", "存在一定负面舆论，建议深入调查原因"),
+    ("中性偏积极", "🟡", "舆论整体正面，需关注潜在风险点"),
+    ("积极", "🟢", "舆论环境良好，适合推进合作/投资"),
+)
+
+# 未找到行业时提示的可选行业列表（静态，返回时复制为列表）
+_INDUSTRY_NAMES = tuple(INDUSTRY_NEWS)
+
+
+def _match_key(name_lower: str, index: Dict[str, str],
+               keys_lower: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+    """先精确匹配小写名称，未命中再按子串双向匹配，均未命中返回 None"""
+    key = index.get(name_lower)
+    if key is not None:
+        return key
+    for key, key_lower in keys_lower:
+        if name_lower in key_lower or key_lower in name_lower:
+            return key
+    return None
+
+
+@lru_cache(maxsize=128)
 def get_company_news(company_name: str, days: int = 30, limit: int = 10) -> Dict:
     """
-    获取公司相关新闻
+    获取公司相关新闻（结果会被缓存并在调用间共享，请勿修改返回值）
 
     Args:
         company_name: 公司名称
@@ -139,21 +174,20 @@ def get_company_news(company_name: str, days: int = 30, limit: int = 10) -> Dict
     Returns:
         新闻列表
     """
-    name_lower = company_name.lower()
-
-    for key, news_list in NEWS_DATABASE.items():
-        if name_lower in key.lower() or key.lower() in name_lower:
-            # 过滤日期（模拟）
-            filtered = news_list[:limit]
-
-            return {
-                "status": "success",
-                "company": key,
-                "news_count": len(filtered),
-                "time_range": f"最近{days}天",
-                "news": filtered,
-                "data_source": "模拟数据 (可对接新闻API)"
-            }
+    key = _match_key(company_name.lower(), _NEWS_INDEX, _NEWS_KEYS_LOWER)
+
+    if key is not None:
+        # 过滤日期（模拟）
+        filtered = NEWS_DATABASE[key][:limit]
+
+        return {
+            "status": "success",
+            "company": key,
+            "news_count": len(filtered),
+            "time_range": f"最近{days}天",
+            "news": filtered,
+            "data_source": "模拟数据 (可对接新闻API)"
+        }
 
     return {
         "status": "not_found",
@@ -162,9 +196,10 @@ def get_company_news(company_name: str, days: int = 30, limit: int = 10) -> Dict
     }
 
 
+@lru_cache(maxsize=128)
 def get_industry_news(industry: str, limit: int = 5) -> Dict:
     """
-    获取行业新闻
+    获取行业新闻（结果会被缓存并在调用间共享，请勿修改返回值）
 
     Args:
         industry: 行业名称
@@ -173,27 +208,28 @@ def get_industry_news(industry: str, limit: int = 5) -> Dict:
     Returns:
         行业新闻列表
     """
-    industry_lower = industry.lower()
-
-    for key, news_list in INDUSTRY_NEWS.items():
-        if industry_lower in key.lower() or key.lower() in industry_lower:
-            return {
-                "status": "success",
-                "industry": key,
-                "news_count": len(news_list[:limit]),
-                "news": news_list[:limit]
-            }
+    key = _match_key(industry.lower(), _INDUSTRY_INDEX, _INDUSTRY_KEYS_LOWER)
+
+    if key is not None:
+        news_list = INDUSTRY_NEWS[key][:limit]
+        return {
+            "status": "success",
+            "industry": key,
+            "news_count": len(news_list),
+            "news": news_list
+        }
 
     return {
         "status": "not_found",
         "message": f"未找到 {industry} 行业的新闻",
-        "available_industries": list(INDUSTRY_NEWS.keys())
+        "available_industries": list(_INDUSTRY_NAMES)
     }
 
 
+@lru_cache(maxsize=128)
 def sentiment_analysis(company_name: str) -> Dict:
     """
-    分析公司舆情
+    分析公司舆情（结果会被缓存并在调用间共享，请勿修改返回值）
 
     Args:
         company_name: 公司名称
@@ -208,21 +244,21 @@ def sentiment_analysis(company_name: str) -> Dict:
 
     news_list = news_result.get("news", [])
 
-    # 统计情感分布
-    sentiment_count = {
-        "positive": 0,
-        "negative": 0,
-        "neutral": 0
-    }
-
-    category_count = {}
+    # 单次遍历：统计情感分布、话题分布，同时收集正/负面标题
+    sentiment_count = Counter(positive=0, negative=0, neutral=0)
+    category_count = Counter()
+    positive_titles = []
+    negative_titles = []
 
     for news in news_list:
         sentiment = news.get("sentiment", "neutral")
-        sentiment_count[sentiment] = sentiment_count.get(sentiment, 0) + 1
+        sentiment_count[sentiment] += 1
+        if sentiment == "positive":
+            positive_titles.append(news["title"])
+        elif sentiment == "negative":
+            negative_titles.append(news["title"])
 
-        category = news.get("category", "其他")
-        category_count[category] = category_count.get(category, 0) + 1
+        category_count[news.get("category", "其他")] += 1
 
     total = len(news_list)
     if total == 0:
@@ -237,21 +273,10 @@ def sentiment_analysis(company_name: str) -> Dict:
     sentiment_score = 50 + (positive_pct - negative_pct) / 2
 
     # 确定整体情感
-    if sentiment_score >= 70:
-        overall_sentiment = "积极"
-        sentiment_emoji = "🟢"
-    elif sentiment_score >= 50:
-        overall_sentiment = "中性偏积极"
-        sentiment_emoji = "🟡"
-    elif sentiment_score >= 30:
-        overall_sentiment = "中性偏消极"
-        sentiment_emoji = "🟠"
-    else:
-        overall_sentiment = "消极"
-        sentiment_emoji = "🔴"
+    overall_sentiment, sentiment_emoji, recommendation = _SENTIMENT_TIERS[bisect_right(_SENTIMENT_EDGES, sentiment_score)]
 
     # 识别主要话题
-    main_topics = sorted(category_count.items(), key=lambda x: x[1], reverse=True)
+    main_topics = sorted(category_count.items(), key=itemgetter(1), reverse=True)
 
     return {
         "status": "success",
@@ -269,22 +294,15 @@ def sentiment_analysis(company_name: str) -> Dict:
             }
         },
         "main_topics": main_topics[:5],
-        "positive_headlines": [n["title"] for n in news_list if n.get("sentiment") == "positive"][:3],
-        "negative_headlines": [n["title"] for n in news_list if n.get("sentiment") == "negative"][:3],
-        "recommendation": get_sentiment_recommendation(sentiment_score)
+        "positive_headlines": positive_titles[:3],
+        "negative_headlines": negative_titles[:3],
+        "recommendation": recommendation
     }
 
 
 def get_sentiment_recommendation(score: float) -> str:
     """根据情感得分给出建议"""
-    if score >= 70:
-        return "舆论环境良好，适合推进合作/投资"
-    elif score >= 50:
-        return "舆论整体正面，需关注潜在风险点"
-    elif score >= 30:
-        return "存在一定负面舆论，建议深入调查原因"
-    else:
-        return "负面舆论较多，需谨慎评估风险"
+    return _SENTIMENT_TIERS[bisect_right(_SENTIMENT_EDGES, score)][2]
 
 
 def get_press_releases(company_name: str, limit: int = 5) -> Dict:
@@ -4,7 +4,10 @@ Risk Scanner Module - 风险扫描模块
 """
 
 from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
+from .hiring_tracker import _today
 
 # 模拟风险数据库
 RISK_DATABASE = {
@@ -159,10 +162,80 @@ RISK_DATABASE = {
     }
 }
 
+# 风险严重程度 -> 分值，以及排序优先级（数值越小越靠前）
+_SEVERITY_SCORES = {"high": 30, "medium": 15, "low": 5}
+_SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
 
+# 综合风险档位：得分达到第 i 个分界即升至第 i+1 档，每档为 (标识, 投资建议)
+_RISK_EDGES = (30, 50, 70)
+_RISK_TIERS = (
+    ("🟢", "风险较低，适合进一步接触"),
+    ("🟡", "中等风险，正常尽调即可"),
+    ("🟠", "中高风险，需详细尽调"),
+    ("🔴", "高风险，建议谨慎"),
+)
+
+# 小写名称 -> 数据库键的精确索引，以及供子串匹配的 (原始键, 小写键)，模块加载时构建一次
+_RISK_INDEX = {key.lower(): key for key in RISK_DATABASE}
+_RISK_KEYS_LOWER = tuple((key, key.lower()) for key in RISK_DATABASE)
+
+
+def _find_risk_key(company_name: str) -> Optional[str]:
+    """将公司名称解析为 RISK_DATABASE 的键：先精确匹配，未命中再按子串匹配"""
+    name_lower = company_name.lower()
+    key = _RISK_INDEX.get(name_lower)
+    if key is not None:
+        return key
+    for key, key_lower in _RISK_KEYS_LOWER:
+        if name_lower in key_lower or key_lower in name_lower:
+            return key
+    return None
+
+
+def _severity_score(risks: List[Dict]) -> int:
+    """按严重程度计算单一维度的风险得分 (0-100)，无风险项时为 0"""
+    if not risks:
+        return 0
+    total_score = sum(_SEVERITY_SCORES.get(r.get("severity", "low"), 0) for r in risks)
+    return min(100, int(total_score / (len(risks) * _SEVERITY_SCORES["high"]) * 100))
+
+
+def _assess(risk_score: int) -> str:
+    """将风险得分映射为风险评估文本"""
+    return "高风险" if risk_score > 60 else "中等风险" if risk_score > 30 else "低风险"
+
+
+def _scan_risks(company_name: str, kind: str) -> Optional[Dict]:
+    """
+    三类风险扫描的公共实现（读取预先计算的风险汇总）
+
+    Args:
+        company_name: 公司名称
+        kind: 风险维度 (legal/financial/reputation)
+
+    Returns:
+        风险评估响应，未找到公司时返回 None
+    """
+    key = _find_risk_key(company_name)
+    if key is None:
+        return None
+
+    risks = RISK_DATABASE[key].get(f"{kind}_risks", [])
+    aggregates = _RISK_AGGREGATES[key]
+    return {
+        "status": "success",
+        "company": key,
+        f"{kind}_risks": risks,
+        "risk_count": len(risks),
+        "risk_score": aggregates[f"{kind}_score"],
+        "assessment": aggregates[f"{kind}_assessment"]
+    }
+
+
+@lru_cache(maxsize=128)
 def scan_legal_risks(company_name: str) -> Dict:
     """
-    扫描法律风险
+    扫描法律风险（结果会被缓存并在调用间共享，请勿修改返回值）
 
     Args:
         company_name: 公司名称
@@ -170,28 +243,13 @@ def scan_legal_risks(company_name: str) -> Dict:
     Returns:
         法律风险评估
     """
-    name_lower = company_name.lower()
+    result = _scan_risks(company_name, "legal")
 
-    for key, data in RISK_DATABASE.items():
-        if name_lower in key.lower() or key.lower() in name_lower:
-            legal_risks = data.get("legal_risks", [])
-
-            # 计算法律风险得分
-            severity_scores = {"high": 30, "medium": 15, "low": 5}
-            total_score = sum(severity_scores.get(r.get("severity", "low"), 0) for r in legal_risks)
-            max_score = len(legal_risks) * 30 if legal_risks else 1
-            risk_score = min(100, int(total_score / max_score * 100)) if legal_risks else 0
-
-            return {
-                "status": "success",
-                "company": key,
-                "legal_risks": legal_risks,
-                "risk_count": len(legal_risks),
-                "high_severity_count": sum(1 for r in legal_risks if r.get("severity") == "high"),
-                "risk_score": risk_score,
-                "assessment": "高风险" if risk_score > 60 else "中等风险" if risk_score > 30 else "低风险",
-                "recommendation": get_legal_recommendation(legal_risks)
-            }
+    if result is not None:
+        aggregates = _RISK_AGGREGATES[result["company"]]
+        result["high_severity_count"] = aggregates["legal_high_count"]
+        result["recommendation"] = aggregates["legal_recommendation"]
+        return result
 
     return {
         "status": "not_found",
@@ -210,9 +268,10 @@ def get_legal_recommendation(risks: List[Dict]) -> str:
     return "未发现重大法律风险"
 
 
+@lru_cache(maxsize=128)
 def scan_financial_risks(company_name: str) -> Dict:
     """
-    扫描财务风险
+    扫描财务风险（结果会被缓存并在调用间共享，请勿修改返回值）
 
     Args:
         company_name: 公司名称
@@ -220,27 +279,11 @@ def scan_financial_risks(company_name: str) -> Dict:
     Returns:
         财务风险评估
     """
-    name_lower = company_name.lower()
+    result = _scan_risks(company_name, "financial")
 
-    for key, data in RISK_DATABASE.items():
-        if name_lower in key.lower() or key.lower() in name_lower:
-            financial_risks = data.get("financial_risks", [])
-
-            # 计算财务风险得分
-            severity_scores = {"high": 30, "medium": 15, "low": 5}
-            total_score = sum(severity_scores.get(r.get("severity", "low"), 0) for r in financial_risks)
-            max_score = len(financial_risks) * 30 if financial_risks else 1
-            risk_score = min(100, int(total_score / max_score * 100)) if financial_risks else 0
-
-            return {
-                "status": "success",
-                "company": key,
-                "financial_risks": financial_risks,
-                "risk_count": len(financial_risks),
-                "risk_score": risk_score,
-                "assessment": "高风险" if risk_score > 60 else "中等风险" if risk_score > 30 else "低风险",
-                "data_source": "模拟数据 (实际应分析财报)"
-            }
+    if result is not None:
+        result["data_source"] = "模拟数据 (实际应分析财报)"
+        return result
 
     return {
         "status": "not_found",
@@ -248,9 +291,10 @@ def scan_financial_risks(company_name: str) -> Dict:
     }
 
 
+@lru_cache(maxsize=128)
 def scan_reputation_risks(company_name: str) -> Dict:
     """
-    扫描声誉风险
+    扫描声誉风险（结果会被缓存并在调用间共享，请勿修改返回值）
 
     Args:
         company_name: 公司名称
@@ -258,26 +302,10 @@ def scan_reputation_risks(company_name: str) -> Dict:
     Returns:
         声誉风险评估
     """
-    name_lower = company_name.lower()
+    result = _scan_risks(company_name, "reputation")
 
-    for key, data in RISK_DATABASE.items():
-        if name_lower in key.lower() or key.lower() in name_lower:
-            reputation_risks = data.get("reputation_risks", [])
-
-            # 计算声誉风险得分
-            severity_scores = {"high": 30, "medium": 15, "low": 5}
-            total_score = sum(severity_scores.get(r.get("severity", "low"), 0) for r in reputation_risks)
-            max_score = len(reputation_risks) * 30 if reputation_risks else 1
-            risk_score = min(100, int(total_score / max_score * 100)) if reputation_risks else 0
-
-            return {
-                "status": "success",
-                "company": key,
-                "reputation_risks": reputation_risks,
-                "risk_count": len(reputation_risks),
-                "risk_score": risk_score,
-                "assessment": "高风险" if risk_score > 60 else "中等风险" if risk_score > 30 else "低风险"
-            }
+    if result is not None:
+        return result
 
     return {
         "status": "not_found",
@@ -295,49 +323,44 @@ def get_risk_score(company_name: str) -> Dict:
     Returns:
         综合风险评分
     """
-    name_lower = company_name.lower()
+    result = _risk_score(company_name)
 
-    for key, data in RISK_DATABASE.items():
-        if name_lower in key.lower() or key.lower() in name_lower:
-            overall_score = data.get("overall_risk_score", 50)
-            risk_level = data.get("risk_level", "中等")
-
-            # 各维度风险
-            legal = scan_legal_risks(company_name)
-            financial = scan_financial_risks(company_name)
-            reputation = scan_reputation_risks(company_name)
-
-            # 风险分布
-            risk_breakdown = {
-                "legal": legal.get("risk_score", 0),
-                "financial": financial.get("risk_score", 0),
-                "reputation": reputation.get("risk_score", 0)
-            }
+    if result.get("status") != "success":
+        return result
 
-            # 风险等级指示
-            if overall_score >= 70:
-                risk_emoji = "🔴"
-                investment_advice = "高风险，建议谨慎"
-            elif overall_score >= 50:
-                risk_emoji = "🟠"
-                investment_advice = "中高风险，需详细尽调"
-            elif overall_score >= 30:
-                risk_emoji = "🟡"
-                investment_advice = "中等风险，正常尽调即可"
-            else:
-                risk_emoji = "🟢"
-                investment_advice = "风险较低，适合进一步接触"
-
-            return {
-                "status": "success",
-                "company": key,
-                "overall_score": overall_score,
-                "risk_level": f"{risk_emoji} {risk_level}",
-                "risk_breakdown": risk_breakdown,
-                "top_risks": get_top_risks(data),
-                "investment_advice": investment_advice,
-                "last_updated": datetime.now().strftime("%Y-%m-%d")
-            }
+    return {**result, "last_updated": _today()}
+
+
+@lru_cache(maxsize=128)
+def _risk_score(company_name: str) -> Dict:
+    """计算综合风险评分（不含更新日期；结果被缓存共享，请勿修改）"""
+    key = _find_risk_key(company_name)
+
+    if key is not None:
+        data = RISK_DATABASE[key]
+        aggregates = _RISK_AGGREGATES[key]
+        overall_score = data.get("overall_risk_score", 50)
+        risk_level = data.get("risk_level", "中等")
+
+        # 风险分布（各维度得分已预先计算）
+        risk_breakdown = {
+            "legal": aggregates["legal_score"],
+            "financial": aggregates["financial_score"],
+            "reputation": aggregates["reputation_score"]
+        }
+
+        # 风险等级指示
+        risk_emoji, investment_advice = _RISK_TIERS[bisect_right(_RISK_EDGES, overall_score)]
+
+        return {
+            "status": "success",
+            "company": key,
+            "overall_score": overall_score,
+            "risk_level": f"{risk_emoji} {risk_level}",
+            "risk_breakdown": risk_breakdown,
+            "top_risks": aggregates["top_risks"],
+            "investment_advice": investment_advice
+        }
 
     return {
         "status": "not_found",
@@ -345,36 +368,64 @@ def get_risk_score(company_name: str) -> Dict:
     }
 
 
-def get_top_risks(data: Dict) -> List[Dict]:
-    """获取最主要的风险项"""
-    all_risks = []
+def get_top_risks(company_name: str) -> List[Dict]:
+    """获取最主要的风险项（预先计算，结果在调用间共享，请勿修改返回值）"""
+    key = _find_risk_key(company_name)
+    return _RISK_AGGREGATES[key]["top_risks"] if key is not None else []
+
+
+def _collect_top_risks(data: Dict) -> List[Dict]:
+    """汇总三个维度的风险项，按严重程度分桶（桶内保持原顺序）后取前 5 项"""
+    buckets = ([], [], [])  # high / medium / low（含未知严重程度）
+
+    for field, prefix in (("legal_risks", "法律"), ("financial_risks", "财务"), ("reputation_risks", "声誉")):
+        for risk in data.get(field, []):
+            severity = risk.get("severity", "low")
+            buckets[_SEVERITY_ORDER.get(severity, 2)].append({
+                "type": f"{prefix}/{risk.get('type', '')}",
+                "severity": severity,
+                "description": risk.get("description", "")
+            })
+
+    high, medium, low = buckets
+    return (high + medium + low)[:5]
 
-    for risk in data.get("legal_risks", []):
-        all_risks.append({
-            "type": f"法律/{risk.get('type', '')}",
-            "severity": risk.get("severity", "low"),
-            "description": risk.get("description", "")
-        })
 
-    for risk in data.get("financial_risks", []):
-        all_risks.append({
-            "type": f"财务/{risk.get('type', '')}",
-            "severity": risk.get("severity", "low"),
-            "description": risk.get("description", "")
-        })
+def _precompute_risk_aggregates() -> Dict[str, Dict]:
+    """为每家公司预先计算各维度风险得分、评估、建议和主要风险项"""
+    aggregates = {}
+    for key, data in RISK_DATABASE.items():
+        legal_risks = data.get("legal_risks", [])
+        legal_score = _severity_score(legal_risks)
+        financial_score = _severity_score(data.get("financial_risks", []))
+        reputation_score = _severity_score(data.get("reputation_risks", []))
+        aggregates[key] = {
+            "legal_score": legal_score,
+            "legal_assessment": _assess(legal_score),
+            "legal_high_count": sum(1 for r in legal_risks if r.get("severity") == "high"),
+            "legal_recommendation": get_legal_recommendation(legal_risks),
+            "financial_score": financial_score,
+            "financial_assessment": _assess(financial_score),
+            "reputation_score": reputation_score,
+            "reputation_assessment": _assess(reputation_score),
+            "top_risks": _collect_top_risks(data)
+        }
+    return aggregates
 
-    for risk in data.get("reputation_risks", []):
-        all_risks.append({
-            "type": f"声誉/{risk.get('type', '')}",
-            "severity": risk.get("severity", "low"),
-            "description": risk.get("description", "")
-        })
 
-    # 按严重程度排序
-    severity_order = {"high": 0, "medium": 1, "low": 2}
-    sorted_risks = sorted(all_risks, key=lambda x: severity_order.get(x.get("severity", "low"), 2))
+# 各公司风险汇总（RISK_DATABASE 为静态数据，模块加载时计算一次）
+_RISK_AGGREGATES = _precompute_risk_aggregates()
 
-    return sorted_risks[:5]
+
+def _profile_for_compare(company_key: str) -> Dict:
+    """从缓存的风险评分中提取对比所需字段"""
+    score = _risk_score(company_key)
+    return {
+        "company": company_key,
+        "overall_score": score["overall_score"],
+        "risk_level": score["risk_level"],
+        "breakdown": score["risk_breakdown"]
+    }
 
 
 def compare_risk_profiles(companies: List[str]) -> Dict:
@@ -390,14 +441,9 @@ def compare_risk_profiles(companies: List[str]) -> Dict:
     profiles = []
 
     for company in companies:
-        score = get_risk_score(company)
-        if score.get("status") == "success":
-            profiles.append({
-                "company": score["company"],
-                "overall_score": score["overall_score"],
-                "risk_level": score["risk_level"],
-                "breakdown": score["risk_breakdown"]
-            })
+        key = _find_risk_key(company)
+        if key is not None:
+            profiles.append(_profile_for_compare(key))
 
     if not profiles:
         return {
@@ -406,11 +452,11 @@ def compare_risk_profiles(companies: List[str]) -> Dict:
         }
 
     # 按风险得分排序（低到高）
-    ranked = sorted(profiles, key=lambda x: x["overall_score"])
+    ranked = sorted(profiles, key=itemgetter("overall_score"))
 
     return {
         "status": "success",
-        "comparison_date": datetime.now().strftime("%Y-%m-%d"),
+        "comparison_date": _today(),
         "companies_compared": len(profiles),
         "ranking_by_safety": ranked,
         "safest": ranked[0]["company"] if ranked else "N/A",
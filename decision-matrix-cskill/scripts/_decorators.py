@@ -0,0 +1,56 @@
+"""
+Decorators Module - 装饰器模块
+决策类接口的公共前置检查
+"""
+
+from functools import wraps
+from typing import Callable, Dict, Optional, Sequence
+from .decision_framer import _get_decision
+
+
+def requires_decision(*, needs: Sequence[str] = (), message: Optional[str] = None) -> Callable:
+    """
+    按决策ID取出决策并做前置检查，被装饰函数的第一个参数直接接收决策对象
+
+    Args:
+        needs: 必须非空的决策字段（如 "options"、"scores"）
+        message: 缺少必要字段时的错误信息（默认指明缺少的字段）
+
+    Returns:
+        装饰器；包装后的函数仍以决策ID作为第一个参数调用
+    """
+    def decorator(fn: Callable) -> Callable:
+        """
+        包装以决策对象为第一个参数的函数
+
+        Args:
+            fn: 被装饰的函数
+
+        Returns:
+            以决策ID为第一个参数的包装函数
+        """
+        @wraps(fn)
+        def wrapper(decision_id: str, *args, **kwargs) -> Dict:
+            """
+            取出决策并检查必要字段，通过后调用被装饰函数
+
+            Args:
+                decision_id: 决策ID
+
+            Returns:
+                被装饰函数的结果；决策不存在或缺少必要数据时返回错误字典
+            """
+            decision, error = _get_decision(decision_id)
+            if error:
+                return error
+
+            for field in needs:
+                if not decision.get(field):
+                    return {
+                        "status": "error",
+                        "message": message or f"决策缺少必要数据: {field}"
+                    }
+
+            return fn(decision, *args, **kwargs)
+        return wrapper
+    return decorator
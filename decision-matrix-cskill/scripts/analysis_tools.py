@@ -3,34 +3,49 @@ Analysis Tools Module - 分析工具模块
 敏感性分析、优劣势分析、风险评估
 """
 
-from datetime import datetime
+from bisect import bisect_right
+from collections import Counter
 from typing import Dict, List, Optional
-from .decision_framer import DECISION_STORE
-from .scoring_engine import calculate_weighted_scores
-
-
-def sensitivity_analysis(decision_id: str, criterion_name: str, weight_range: List[float] = None) -> Dict:
+from ._decorators import requires_decision
+from .scoring_engine import _decision_score_matrix, _rank_by_weights
+
+# 优劣势判定所用的 (是否正向, 优势说明, 劣势说明)
+_BENEFIT_NOTES = (True, "表现优秀", "需要改进")
+_COST_NOTES = (False, "成本/风险低", "成本/风险高")
+
+# 单项风险档位：分数达到第 i 个分界即升至第 i+1 档，每档为 (等级, 标识)
+_CRITERION_RISK_EDGES = (5, 8)
+_CRITERION_RISK_TIERS = (
+    ("低风险", "🟢"),
+    ("中风险", "🟡"),
+    ("高风险", "🔴"),
+)
+
+# 综合风险档位：得分达到第 i 个分界即升至第 i+1 档，每档为 (等级, 标识, 建议)
+_OVERALL_RISK_EDGES = (4, 7)
+_OVERALL_RISK_TIERS = (
+    ("低风险", "🟢", "风险可控"),
+    ("中风险", "🟡", "可接受，但需要监控"),
+    ("高风险", "🔴", "需要制定风险缓解措施"),
+)
+
+
+@requires_decision()
+def sensitivity_analysis(decision: Dict, criterion_name: str, weight_range: List[float] = None) -> Dict:
     """
     敏感性分析 - 分析标准权重变化对结果的影响
 
     Args:
-        decision_id: 决策ID
+        decision: 决策对象（调用时传入决策ID，由 requires_decision 解析）
         criterion_name: 要分析的标准名称
         weight_range: 权重变化范围 [min, max]
 
     Returns:
         敏感性分析结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
-
     if weight_range is None:
         weight_range = [0.05, 0.50]
 
-    decision = DECISION_STORE[decision_id]
     criteria = decision.get("criteria", [])
 
     # 找到目标标准
@@ -49,48 +64,38 @@ def sensitivity_analysis(decision_id: str, criterion_name: str, weight_range: Li
     original_weight = target_criterion["weight"]
     results = []
 
-    # 测试不同权重
-    test_weights = [
-        weight_range[0],
-        (weight_range[0] + original_weight) / 2,
+    # 固定的5点测试网格：下限、下限与当前的中点、当前、当前与上限的中点、上限
+    w_min, w_max = weight_range[0], weight_range[1]
+    test_weights = (
+        w_min,
+        (w_min + original_weight) / 2,
         original_weight,
-        (original_weight + weight_range[1]) / 2,
-        weight_range[1]
-    ]
-
-    for test_weight in test_weights:
-        # 临时修改权重
-        target_criterion["weight"] = test_weight
+        (original_weight + w_max) / 2,
+        w_max
+    )
 
-        # 归一化其他权重
-        other_total = sum(c["weight"] for c in criteria if c["name"] != criterion_name)
-        scale = (1 - test_weight) / other_total if other_total > 0 else 0
+    # 得分矩阵只构建一次，各测试点只替换权重向量，不改动存储中的标准
+    matrix = _decision_score_matrix(decision)
 
-        temp_weights = {}
-        for c in criteria:
-            if c["name"] != criterion_name:
-                temp_weights[c["name"]] = c["weight"]
-                c["weight"] = c["weight"] * scale
+    if matrix is not None:
+        rows = matrix[1]
 
-        # 计算结果
-        weighted = calculate_weighted_scores(decision_id)
+        # 其余标准的原始权重只取一次（目标标准位置记为 None），各测试点只按比例缩放
+        base_weights = [None if c["name"] == criterion_name else c["weight"] for c in criteria]
+        other_total = sum(w for w in base_weights if w is not None)
 
-        if weighted.get("status") == "success":
-            rankings = weighted.get("results", [])
-            winner = rankings[0]["option_name"] if rankings else None
+        for test_weight in test_weights:
+            # 目标标准取测试权重，其余标准按比例缩放
+            scale = (1 - test_weight) / other_total if other_total > 0 else 0
+            weights = [test_weight if w is None else w * scale for w in base_weights]
 
+            rankings = _rank_by_weights(rows, weights, top_k=3)
             results.append({
                 "weight": round(test_weight, 2),
-                "winner": winner,
-                "rankings": [r["option_name"] for r in rankings[:3]]
+                "winner": rankings[0][0] if rankings else None,
+                "rankings": [name for name, _ in rankings]
             })
 
-        # 恢复权重
-        target_criterion["weight"] = original_weight
-        for c in criteria:
-            if c["name"] in temp_weights:
-                c["weight"] = temp_weights[c["name"]]
-
     # 分析结果变化
     winners = [r["winner"] for r in results]
     is_stable = len(set(winners)) == 1
@@ -107,66 +112,55 @@ def sensitivity_analysis(decision_id: str, criterion_name: str, weight_range: Li
     }
 
 
-def pros_cons_analysis(decision_id: str) -> Dict:
+@requires_decision(needs=("options", "scores"), message="需要先添加选项和评分")
+def pros_cons_analysis(decision: Dict) -> Dict:
     """
     优劣势对比分析
 
     Args:
-        decision_id: 决策ID
+        decision: 决策对象（调用时传入决策ID，由 requires_decision 解析）
 
     Returns:
         优劣势分析结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
-
-    decision = DECISION_STORE[decision_id]
     options = decision.get("options", [])
     criteria = decision.get("criteria", [])
     scores = decision.get("scores", {})
 
-    if not options or not scores:
-        return {
-            "status": "error",
-            "message": "需要先添加选项和评分"
-        }
+    # 标准名 -> (是否正向, 优势说明, 劣势说明)，每个标准只判断一次类型
+    criteria_by_name = {
+        c["name"]: _BENEFIT_NOTES if c.get("type", "benefit") == "benefit" else _COST_NOTES
+        for c in criteria
+    }
 
     analysis = []
+    scores_get = scores.get
+    notes_get = criteria_by_name.get
 
     for option in options:
-        opt_id = option["id"]
-        opt_name = option["name"]
-
-        if opt_id not in scores:
+        opt_scores = scores_get(option["id"])
+        if opt_scores is None:
             continue
 
-        opt_scores = scores[opt_id]
+        opt_name = option["name"]
 
         # 找出优势和劣势
         strengths = []
         weaknesses = []
 
         for criterion_name, score in opt_scores.items():
-            # 找到标准类型
-            criterion = next((c for c in criteria if c["name"] == criterion_name), None)
-            if not criterion:
+            notes = notes_get(criterion_name)
+            if notes is None:
                 continue
 
-            crit_type = criterion.get("type", "benefit")
+            is_benefit, strength_note, weakness_note = notes
 
-            if crit_type == "benefit":
-                if score >= 8:
-                    strengths.append({"criterion": criterion_name, "score": score, "note": "表现优秀"})
-                elif score <= 4:
-                    weaknesses.append({"criterion": criterion_name, "score": score, "note": "需要改进"})
-            else:  # cost
-                if score <= 3:  # 低成本是好事
-                    strengths.append({"criterion": criterion_name, "score": score, "note": "成本/风险低"})
-                elif score >= 7:  # 高成本是坏事
-                    weaknesses.append({"criterion": criterion_name, "score": score, "note": "成本/风险高"})
+            # cost 类型按 11-分数 换算后与 benefit 共用阈值（cost 原始分 ≤3 为优势、≥7 为劣势）
+            adjusted_score = score if is_benefit else 11 - score
+            if adjusted_score >= 8:
+                strengths.append({"criterion": criterion_name, "score": score, "note": strength_note})
+            elif adjusted_score <= 4:
+                weaknesses.append({"criterion": criterion_name, "score": score, "note": weakness_note})
 
         # 也包含选项自带的pros/cons
         option_pros = option.get("pros", [])
@@ -192,23 +186,17 @@ def pros_cons_analysis(decision_id: str) -> Dict:
     }
 
 
-def risk_assessment(decision_id: str) -> Dict:
+@requires_decision()
+def risk_assessment(decision: Dict) -> Dict:
     """
     风险评估
 
     Args:
-        decision_id: 决策ID
+        decision: 决策对象（调用时传入决策ID，由 requires_decision 解析）
 
     Returns:
         风险评估结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
-
-    decision = DECISION_STORE[decision_id]
     options = decision.get("options", [])
     criteria = decision.get("criteria", [])
     scores = decision.get("scores", {})
@@ -223,63 +211,46 @@ def risk_assessment(decision_id: str) -> Dict:
             "suggestion": "建议添加风险、成本等负向标准"
         }
 
+    # 风险标准的 (名称, 权重) 及权重总和与选项无关，循环外只算一次
+    risk_items = [(c["name"], c.get("weight", 0)) for c in risk_criteria]
+    total_risk_weight = sum(weight for _, weight in risk_items)
+
     assessments = []
+    scores_get = scores.get
 
     for option in options:
-        opt_id = option["id"]
-        opt_name = option["name"]
-
-        if opt_id not in scores:
+        opt_scores = scores_get(option["id"])
+        if opt_scores is None:
             continue
 
-        opt_scores = scores[opt_id]
+        opt_name = option["name"]
 
         risk_total = 0
         risk_count = 0
         risk_details = []
 
-        for criterion in risk_criteria:
-            crit_name = criterion["name"]
-            if crit_name in opt_scores:
-                score = opt_scores[crit_name]
-                weight = criterion.get("weight", 0)
-
-                risk_total += score * weight
-                risk_count += 1
-
-                # 风险等级
-                if score >= 8:
-                    risk_level = "高风险"
-                    emoji = "🔴"
-                elif score >= 5:
-                    risk_level = "中风险"
-                    emoji = "🟡"
-                else:
-                    risk_level = "低风险"
-                    emoji = "🟢"
-
-                risk_details.append({
-                    "criterion": crit_name,
-                    "score": score,
-                    "level": risk_level,
-                    "emoji": emoji
-                })
+        for crit_name, weight in risk_items:
+            score = opt_scores.get(crit_name)
+            if score is None:
+                continue
+
+            risk_total += score * weight
+            risk_count += 1
+
+            # 风险等级
+            risk_level, emoji = _CRITERION_RISK_TIERS[bisect_right(_CRITERION_RISK_EDGES, score)]
+
+            risk_details.append({
+                "criterion": crit_name,
+                "score": score,
+                "level": risk_level,
+                "emoji": emoji
+            })
 
         # 计算综合风险得分
-        overall_risk = risk_total / sum(c.get("weight", 0) for c in risk_criteria) if risk_criteria else 0
-
-        if overall_risk >= 7:
-            overall_level = "高风险"
-            overall_emoji = "🔴"
-            recommendation = "需要制定风险缓解措施"
-        elif overall_risk >= 4:
-            overall_level = "中风险"
-            overall_emoji = "🟡"
-            recommendation = "可接受，但需要监控"
-        else:
-            overall_level = "低风险"
-            overall_emoji = "🟢"
-            recommendation = "风险可控"
+        overall_risk = risk_total / total_risk_weight if total_risk_weight else 0
+
+        overall_level, overall_emoji, recommendation = _OVERALL_RISK_TIERS[bisect_right(_OVERALL_RISK_EDGES, overall_risk)]
 
         assessments.append({
             "option_name": opt_name,
@@ -303,23 +274,18 @@ def risk_assessment(decision_id: str) -> Dict:
     }
 
 
-def scenario_analysis(decision_id: str, scenarios: List[Dict]) -> Dict:
+@requires_decision()
+def scenario_analysis(decision: Dict, scenarios: List[Dict]) -> Dict:
     """
     场景分析 - 在不同场景下评估决策
 
     Args:
-        decision_id: 决策ID
+        decision: 决策对象（调用时传入决策ID，由 requires_decision 解析）
         scenarios: 场景列表 [{"name": "乐观", "weight_adjustments": {"回报": 1.5}}]
 
     Returns:
         场景分析结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
-
     if not scenarios:
         # 使用默认场景
         scenarios = [
@@ -328,43 +294,36 @@ def scenario_analysis(decision_id: str, scenarios: List[Dict]) -> Dict:
             {"name": "悲观情景", "weight_adjustments": {"风险水平": 1.5}}   # 提高风险权重
         ]
 
-    decision = DECISION_STORE[decision_id]
     criteria = decision.get("criteria", [])
 
     results = []
 
-    for scenario in scenarios:
-        scenario_name = scenario.get("name", "未命名场景")
-        adjustments = scenario.get("weight_adjustments", {})
+    # 得分矩阵只构建一次，各场景只替换权重向量，不改动存储中的标准
+    matrix = _decision_score_matrix(decision)
 
-        # 临时调整权重
-        original_weights = {c["name"]: c["weight"] for c in criteria}
+    if matrix is not None:
+        rows = matrix[1]
 
-        for c in criteria:
-            if c["name"] in adjustments:
-                c["weight"] = original_weights[c["name"]] * adjustments[c["name"]]
+        for scenario in scenarios:
+            scenario_name = scenario.get("name", "未命名场景")
+            adjustments = scenario.get("weight_adjustments", {})
 
-        # 归一化
-        total = sum(c["weight"] for c in criteria)
-        for c in criteria:
-            c["weight"] = c["weight"] / total if total > 0 else 0
+            # 调整权重后归一化
+            weights = [
+                c["weight"] * adjustments[c["name"]] if c["name"] in adjustments else c["weight"]
+                for c in criteria
+            ]
+            total = sum(weights)
+            weights = [w / total if total > 0 else 0 for w in weights]
 
-        # 计算该场景下的结果
-        weighted = calculate_weighted_scores(decision_id)
-
-        if weighted.get("status") == "success":
-            rankings = weighted.get("results", [])
+            rankings = _rank_by_weights(rows, weights)
             results.append({
                 "scenario": scenario_name,
-                "winner": rankings[0]["option_name"] if rankings else None,
-                "winner_score": rankings[0]["normalized_score"] if rankings else 0,
-                "full_rankings": [{"option": r["option_name"], "score": r["normalized_score"]} for r in rankings]
+                "winner": rankings[0][0] if rankings else None,
+                "winner_score": round(rankings[0][1] / 10 * 100, 1) if rankings else 0,
+                "full_rankings": [{"option": name, "score": round(total_score / 10 * 100, 1)} for name, total_score in rankings]
             })
 
-        # 恢复原始权重
-        for c in criteria:
-            c["weight"] = original_weights[c["name"]]
-
     # 分析一致性
     winners = [r["winner"] for r in results]
     is_robust = len(set(winners)) == 1
@@ -376,5 +335,5 @@ def scenario_analysis(decision_id: str, scenarios: List[Dict]) -> Dict:
         "results": results,
         "is_robust": is_robust,
         "robustness_assessment": "决策在各场景下一致" if is_robust else "决策因场景而异，需要更多考量",
-        "most_frequent_winner": max(set(winners), key=winners.count) if winners else None
+        "most_frequent_winner": Counter(winners).most_common(1)[0][0] if winners else None
     }
@@ -3,9 +3,9 @@ Criteria Manager Module - 标准管理模块
 管理决策评估标准和权重
 """
 
-from datetime import datetime
+from collections import Counter
 from typing import Dict, List, Optional
-from .decision_framer import DECISION_STORE
+from .decision_framer import _get_decision, _criteria_state, _touch
 
 
 def add_criterion(
@@ -28,11 +28,9 @@ def add_criterion(
     Returns:
         添加结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
     if not 0 <= weight <= 1:
         return {
@@ -46,15 +44,13 @@ def add_criterion(
             "message": "类型必须是 'benefit' 或 'cost'"
         }
 
-    decision = DECISION_STORE[decision_id]
-
     # 检查是否已存在
-    for c in decision.get("criteria", []):
-        if c["name"] == name:
-            return {
-                "status": "error",
-                "message": f"标准 '{name}' 已存在"
-            }
+    state = _criteria_state(decision)
+    if name in state.index:
+        return {
+            "status": "error",
+            "message": f"标准 '{name}' 已存在"
+        }
 
     criterion = {
         "name": name,
@@ -63,18 +59,18 @@ def add_criterion(
         "description": description
     }
 
-    if "criteria" not in decision:
-        decision["criteria"] = []
-
     decision["criteria"].append(criterion)
-    decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    state.index[name] = criterion
+    state.count += 1
+    state.total_weight += weight
+    _touch(decision)
 
     return {
         "status": "success",
         "message": f"标准 '{name}' 已添加",
         "criterion": criterion,
         "total_criteria": len(decision["criteria"]),
-        "total_weight": sum(c["weight"] for c in decision["criteria"])
+        "total_weight": state.total_weight
     }
 
 
@@ -89,27 +85,30 @@ def remove_criterion(decision_id: str, name: str) -> Dict:
     Returns:
         移除结果
     """
-    if decision_id not in DECISION_STORE:
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
+
+    state = _criteria_state(decision)
+    if name not in state.index:
         return {
             "status": "error",
-            "message": f"未找到决策: {decision_id}"
+            "message": f"未找到标准: {name}"
         }
 
-    decision = DECISION_STORE[decision_id]
-    criteria = decision.get("criteria", [])
-
+    criteria = decision["criteria"]
     for i, c in enumerate(criteria):
         if c["name"] == name:
-            removed = criteria.pop(i)
-            decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-            return {
-                "status": "success",
-                "message": f"标准 '{name}' 已移除"
-            }
+            criteria.pop(i)
+            break
+    del state.index[name]
+    state.count -= 1
+    state.total_weight = sum(c["weight"] for c in criteria)
+    _touch(decision)
 
     return {
-        "status": "error",
-        "message": f"未找到标准: {name}"
+        "status": "success",
+        "message": f"标准 '{name}' 已移除"
     }
 
 
@@ -123,16 +122,13 @@ def get_criteria(decision_id: str) -> Dict:
     Returns:
         标准列表
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    decision = DECISION_STORE[decision_id]
     criteria = decision.get("criteria", [])
 
-    total_weight = sum(c["weight"] for c in criteria)
+    total_weight = _criteria_state(decision).total_weight
 
     return {
         "status": "success",
@@ -155,24 +151,24 @@ def set_weights(decision_id: str, weights: Dict[str, float]) -> Dict:
     Returns:
         设置结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    decision = DECISION_STORE[decision_id]
-    criteria = decision.get("criteria", [])
+    state = _criteria_state(decision)
+    criteria = state.criteria
 
+    # 更新权重的同时累计新的总权重
     updated = []
+    total_weight = 0
     for c in criteria:
         if c["name"] in weights:
             c["weight"] = weights[c["name"]]
             updated.append(c["name"])
+        total_weight += c["weight"]
+    state.total_weight = total_weight
 
-    decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-    total_weight = sum(c["weight"] for c in criteria)
+    _touch(decision)
 
     return {
         "status": "success",
@@ -193,14 +189,12 @@ def normalize_weights(decision_id: str) -> Dict:
     Returns:
         归一化结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    decision = DECISION_STORE[decision_id]
-    criteria = decision.get("criteria", [])
+    state = _criteria_state(decision)
+    criteria = state.criteria
 
     if not criteria:
         return {
@@ -208,19 +202,24 @@ def normalize_weights(decision_id: str) -> Dict:
             "message": "没有可归一化的标准"
         }
 
-    total_weight = sum(c["weight"] for c in criteria)
+    total_weight = state.total_weight
 
+    # 归一化的同时累计新的总权重
+    new_total = 0
     if total_weight == 0:
         # 平均分配
         avg_weight = 1.0 / len(criteria)
         for c in criteria:
             c["weight"] = avg_weight
+            new_total += avg_weight
     else:
         # 按比例归一化
         for c in criteria:
             c["weight"] = c["weight"] / total_weight
+            new_total += c["weight"]
+    state.total_weight = new_total
 
-    decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    _touch(decision)
 
     return {
         "status": "success",
@@ -240,13 +239,10 @@ def suggest_weights(decision_id: str, priority_order: List[str] = None) -> Dict:
     Returns:
         建议权重
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    decision = DECISION_STORE[decision_id]
     criteria = decision.get("criteria", [])
 
     if not criteria:
@@ -258,10 +254,11 @@ def suggest_weights(decision_id: str, priority_order: List[str] = None) -> Dict:
     n = len(criteria)
 
     if priority_order:
-        # 根据优先级顺序分配权重（线性递减）
+        # 根据优先级顺序分配权重（线性递减），分母为 1+2+…+n
+        rank_total = n * (n + 1) // 2
         suggested = {}
         for i, name in enumerate(priority_order):
-            weight = (n - i) / sum(range(1, n + 1))
+            weight = (n - i) / rank_total
             suggested[name] = round(weight, 3)
     else:
         # 平均分配
@@ -284,13 +281,10 @@ def validate_criteria(decision_id: str) -> Dict:
     Returns:
         验证结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    decision = DECISION_STORE[decision_id]
     criteria = decision.get("criteria", [])
 
     issues = []
@@ -298,7 +292,7 @@ def validate_criteria(decision_id: str) -> Dict:
     if not criteria:
         issues.append("未设置任何评估标准")
 
-    total_weight = sum(c["weight"] for c in criteria)
+    total_weight = _criteria_state(decision).total_weight
     if abs(total_weight - 1.0) > 0.01:
         issues.append(f"权重总和为 {total_weight:.2f}，建议归一化为1.0")
 
@@ -308,8 +302,10 @@ def validate_criteria(decision_id: str) -> Dict:
     if len(criteria) > 10:
         issues.append("标准过多可能影响决策质量，建议精简")
 
-    benefit_count = sum(1 for c in criteria if c.get("type") == "benefit")
-    cost_count = sum(1 for c in criteria if c.get("type") == "cost")
+    # 单次遍历统计各类型标准数量
+    type_counts = Counter(c.get("type") for c in criteria)
+    benefit_count = type_counts["benefit"]
+    cost_count = type_counts["cost"]
 
     if benefit_count == 0:
         issues.append("没有正向标准(benefit)，建议添加")
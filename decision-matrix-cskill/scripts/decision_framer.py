@@ -4,12 +4,50 @@ Decision Framer Module - 决策框架模块
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
-import uuid
+from typing import Dict, List, Optional, Tuple
+from itertools import count
+from types import MappingProxyType
+import secrets
+import time
 
 # 决策存储
 DECISION_STORE = {}
 
+
+class _CriteriaState:
+    """决策标准的派生状态：标准名索引与权重总和，由 criteria_manager 在增删标准、修改权重时同步维护"""
+
+    __slots__ = ("criteria", "count", "index", "total_weight")
+
+    def __init__(self, criteria: List[Dict]):
+        self.criteria = criteria
+        self.count = len(criteria)
+        self.index = {c["name"]: c for c in criteria}
+        self.total_weight = sum(c["weight"] for c in criteria)
+
+
+# 决策ID -> 标准派生状态，由 _criteria_state 维护
+_CRITERIA_STATE: Dict[str, _CriteriaState] = {}
+
+
+class _OptionsState:
+    """决策选项的派生状态：选项ID索引，由 option_generator 在增删选项时同步维护"""
+
+    __slots__ = ("options", "count", "index")
+
+    def __init__(self, options: List[Dict]):
+        self.options = options
+        self.count = len(options)
+        # ID 重复时以先出现者为准，与按顺序线性查找的结果一致
+        index = {}
+        for o in options:
+            index.setdefault(o["id"], o)
+        self.index = index
+
+
+# 决策ID -> 选项派生状态，由 _options_state 维护
+_OPTIONS_STATE: Dict[str, _OptionsState] = {}
+
 # 决策模板
 DECISION_TEMPLATES = {
     "investment": {
@@ -71,6 +109,111 @@ DECISION_TEMPLATES = {
     }
 }
 
+# 模板在模块加载时冻结为只读结构，防止通过决策误改模板；应用模板时用 _clone_criteria 复制
+DECISION_TEMPLATES = MappingProxyType({
+    key: MappingProxyType({
+        **tpl,
+        "suggested_criteria": tuple(MappingProxyType(c) for c in tpl["suggested_criteria"])
+    })
+    for key, tpl in DECISION_TEMPLATES.items()
+})
+
+
+def _clone_criteria(tpl_criteria) -> List[Dict]:
+    """复制模板标准为决策自有的可修改列表（每个标准为独立的浅拷贝）"""
+    return [c.copy() for c in tpl_criteria]
+
+
+# 当前分钟的时间戳字符串缓存：[分钟序号, "%Y-%m-%d %H:%M"]
+_now_cache = [None, ""]
+
+
+def _now_str() -> str:
+    """返回当前时间的 "%Y-%m-%d %H:%M" 字符串（同一分钟内复用已格式化的结果）"""
+    now = time.time()
+    minute = int(now // 60)
+    if minute != _now_cache[0]:
+        _now_cache[0] = minute
+        _now_cache[1] = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M")
+    return _now_cache[1]
+
+
+# 决策ID -> 修改版本号（全局递增，每次修改决策时更新），用作派生数据缓存的失效标记
+_DECISION_VERSION: Dict[str, int] = {}
+_version_counter = count()
+
+
+def _touch(decision: Dict, now: Optional[str] = None) -> None:
+    """
+    记录决策被修改：刷新 updated_at 并递增版本号（所有修改决策的接口都应调用）
+
+    Args:
+        decision: 决策对象
+        now: 调用方已取得的时间戳字符串（可选），使同一次修改中的各时间字段一致
+    """
+    decision["updated_at"] = now if now is not None else _now_str()
+    _DECISION_VERSION[decision["id"]] = next(_version_counter)
+
+
+def _get_decision(decision_id: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    按ID取决策（单次字典查找）
+
+    Args:
+        decision_id: 决策ID
+
+    Returns:
+        (决策对象, None)；未找到时为 (None, 错误响应)
+    """
+    decision = DECISION_STORE.get(decision_id)
+    if decision is None:
+        return None, {
+            "status": "error",
+            "message": f"未找到决策: {decision_id}"
+        }
+    return decision, None
+
+
+def _criteria_state(decision: Dict) -> _CriteriaState:
+    """
+    获取决策的标准派生状态（标准名索引、权重总和），用于 O(1) 判重和读取总权重
+
+    标准列表被整体替换（如应用模板、update_decision）或长度与记录不符时自动重建；
+    直接修改标准字典中的权重不会被察觉，应通过 set_weights / normalize_weights 修改
+
+    Args:
+        decision: 决策对象
+
+    Returns:
+        标准派生状态（调用方增删标准或改权重后需同步更新 count / index / total_weight）
+    """
+    criteria = decision.setdefault("criteria", [])
+    state = _CRITERIA_STATE.get(decision["id"])
+    if state is None or state.criteria is not criteria or state.count != len(criteria):
+        state = _CriteriaState(criteria)
+        _CRITERIA_STATE[decision["id"]] = state
+    return state
+
+
+def _options_state(decision: Dict) -> _OptionsState:
+    """
+    获取决策的选项派生状态（选项ID索引），用于 O(1) 按ID查找选项
+
+    选项列表被整体替换（如 update_decision）或长度与记录不符时自动重建
+
+    Args:
+        decision: 决策对象
+
+    Returns:
+        选项派生状态（调用方增删选项后需同步更新 count / index，或丢弃该状态）
+    """
+    options = decision.setdefault("options", [])
+    state = _OPTIONS_STATE.get(decision["id"])
+    if state is None or state.options is not options or state.count != len(options):
+        state = _OptionsState(options)
+        _OPTIONS_STATE[decision["id"]] = state
+    return state
+
 
 def create_decision(
     title: str,
@@ -92,15 +235,19 @@ def create_decision(
     Returns:
         创建的决策对象
     """
-    decision_id = str(uuid.uuid4())[:8]
+    # 8位十六进制ID，与已有决策冲突时重新生成
+    decision_id = secrets.token_hex(4)
+    while decision_id in DECISION_STORE:
+        decision_id = secrets.token_hex(4)
+    now = _now_str()
 
     decision = {
         "id": decision_id,
         "title": title,
         "description": description,
         "status": "draft",
-        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
-        "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "created_at": now,
+        "updated_at": now,
         "deadline": deadline,
         "stakeholders": stakeholders or [],
         "options": [],
@@ -113,9 +260,10 @@ def create_decision(
     if template and template in DECISION_TEMPLATES:
         tpl = DECISION_TEMPLATES[template]
         decision["template"] = template
-        decision["criteria"] = tpl.get("suggested_criteria", [])
+        decision["criteria"] = _clone_criteria(tpl.get("suggested_criteria", ()))
 
     DECISION_STORE[decision_id] = decision
+    _DECISION_VERSION[decision_id] = next(_version_counter)
 
     return {
         "status": "success",
@@ -135,15 +283,13 @@ def get_decision(decision_id: str) -> Dict:
     Returns:
         决策对象
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
     return {
         "status": "success",
-        "decision": DECISION_STORE[decision_id]
+        "decision": decision
     }
 
 
@@ -190,20 +336,16 @@ def update_decision(decision_id: str, updates: Dict) -> Dict:
     Returns:
         更新结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
-
-    decision = DECISION_STORE[decision_id]
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
     # 应用更新
     for key, value in updates.items():
         if key not in ["id", "created_at"]:  # 保护不可变字段
             decision[key] = value
 
-    decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    _touch(decision)
 
     return {
         "status": "success",
@@ -222,17 +364,18 @@ def delete_decision(decision_id: str) -> Dict:
     Returns:
         删除结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    deleted = DECISION_STORE.pop(decision_id)
+    del DECISION_STORE[decision_id]
+    _CRITERIA_STATE.pop(decision_id, None)
+    _OPTIONS_STATE.pop(decision_id, None)
+    _DECISION_VERSION.pop(decision_id, None)
 
     return {
         "status": "success",
-        "message": f"决策 '{deleted['title']}' 已删除"
+        "message": f"决策 '{decision['title']}' 已删除"
     }
 
 
@@ -264,11 +407,9 @@ def apply_template(decision_id: str, template: str) -> Dict:
     Returns:
         应用结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
     if template not in DECISION_TEMPLATES:
         return {
@@ -278,11 +419,10 @@ def apply_template(decision_id: str, template: str) -> Dict:
         }
 
     tpl = DECISION_TEMPLATES[template]
-    decision = DECISION_STORE[decision_id]
 
     decision["template"] = template
-    decision["criteria"] = tpl.get("suggested_criteria", [])
-    decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    decision["criteria"] = _clone_criteria(tpl.get("suggested_criteria", ()))
+    _touch(decision)
 
     return {
         "status": "success",
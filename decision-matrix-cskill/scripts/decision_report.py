@@ -3,12 +3,28 @@ Decision Report Module - 决策报告模块
 生成各类决策分析报告
 """
 
-from datetime import datetime
 from typing import Dict, List, Optional
-from .decision_framer import DECISION_STORE
+from .decision_framer import DECISION_STORE, _now_str
 from .scoring_engine import calculate_weighted_scores, rank_options, get_recommendation
 from .analysis_tools import pros_cons_analysis, risk_assessment
 
+# 报告分隔线
+_RULE = "=" * 70
+
+# 完整报告封面的固定行（标题、时间行随决策变化，仍在调用时居中）
+_COVER_TOP = "╔" + "═" * 68 + "╗"
+_COVER_HEADING = "║" + "📋 决策分析报告".center(64) + "║"
+_COVER_BOTTOM = "╚" + "═" * 68 + "╝"
+
+# 执行摘要边框的固定行
+_SUMMARY_TOP = "┌" + "─" * 58 + "┐"
+_SUMMARY_HEADING = "│" + "📋 执行摘要".center(54) + "│"
+_SUMMARY_DIVIDER = "├" + "─" * 58 + "┤"
+_SUMMARY_BOTTOM = "└" + "─" * 58 + "┘"
+
+# 前三名奖牌
+_MEDALS = ("🥇", "🥈", "🥉")
+
 
 def generate_quick_summary(decision_id: str) -> str:
     """
@@ -20,10 +36,10 @@ def generate_quick_summary(decision_id: str) -> str:
     Returns:
         一句话摘要
     """
-    if decision_id not in DECISION_STORE:
+    decision = DECISION_STORE.get(decision_id)
+    if decision is None:
         return f"❌ 未找到决策: {decision_id}"
 
-    decision = DECISION_STORE[decision_id]
     recommendation = get_recommendation(decision_id)
 
     if recommendation.get("status") != "success":
@@ -47,29 +63,46 @@ def generate_decision_matrix(decision_id: str) -> str:
     Returns:
         格式化的决策矩阵
     """
-    if decision_id not in DECISION_STORE:
+    decision = DECISION_STORE.get(decision_id)
+    if decision is None:
         return f"❌ 未找到决策: {decision_id}"
 
-    decision = DECISION_STORE[decision_id]
+    lines = []
+    _append_decision_matrix(lines, decision_id, decision)
+    return "\n".join(lines)
+
+
+def _append_decision_matrix(lines: List[str], decision_id: str, decision: Dict) -> None:
+    """
+    将决策矩阵表格逐行追加到 lines（完整报告直接复用同一缓冲区）
+
+    Args:
+        lines: 输出行缓冲区
+        decision_id: 决策ID
+        decision: 决策对象
+    """
     options = decision.get("options", [])
     criteria = decision.get("criteria", [])
     scores = decision.get("scores", {})
 
     if not options or not criteria:
-        return "⚠️ 需要先添加选项和标准"
+        lines.append("⚠️ 需要先添加选项和标准")
+        return
 
-    lines = []
-    lines.append("=" * 70)
-    lines.append(f"📊 决策矩阵: {decision.get('title', '未命名决策')}")
-    lines.append("=" * 70)
-    lines.append("")
+    separator = "|" + "-" * 14 + "|" + ("-" * 12 + "|") * len(options)
+
+    lines.extend((
+        _RULE,
+        f"📊 决策矩阵: {decision.get('title', '未命名决策')}",
+        _RULE,
+        ""
+    ))
 
     # 表头
-    header = "| 标准 (权重) |"
-    for opt in options:
-        header += f" {opt['name'][:8]:^10} |"
-    lines.append(header)
-    lines.append("|" + "-" * 14 + "|" + ("-" * 12 + "|") * len(options))
+    header = ["| 标准 (权重) |"]
+    header.extend(f" {opt['name'][:8]:^10} |" for opt in options)
+    lines.append("".join(header))
+    lines.append(separator)
 
     # 数据行
     for criterion in criteria:
@@ -78,39 +111,39 @@ def generate_decision_matrix(decision_id: str) -> str:
         crit_type = criterion.get("type", "benefit")
         type_mark = "↑" if crit_type == "benefit" else "↓"
 
-        row = f"| {crit_name[:8]:8} ({weight:.2f}){type_mark} |"
+        row = [f"| {crit_name[:8]:8} ({weight:.2f}){type_mark} |"]
 
         for opt in options:
             opt_id = opt["id"]
             if opt_id in scores and crit_name in scores[opt_id]:
                 score = scores[opt_id][crit_name]
-                row += f" {score:^10} |"
+                row.append(f" {score:^10} |")
             else:
-                row += f" {'--':^10} |"
+                row.append(f" {'--':^10} |")
 
-        lines.append(row)
+        lines.append("".join(row))
 
-    lines.append("|" + "-" * 14 + "|" + ("-" * 12 + "|") * len(options))
+    lines.append(separator)
 
     # 加权得分
-    weighted = calculate_weighted_scores(decision_id)
+    weighted = calculate_weighted_scores(decision_id, include_details=False)
     if weighted.get("status") == "success":
         results = {r["option_id"]: r["normalized_score"] for r in weighted.get("results", [])}
 
-        score_row = "| **加权得分** |"
+        score_row = ["| **加权得分** |"]
         for opt in options:
             opt_id = opt["id"]
             if opt_id in results:
-                score_row += f" {results[opt_id]:^10.1f} |"
+                score_row.append(f" {results[opt_id]:^10.1f} |")
             else:
-                score_row += f" {'--':^10} |"
-        lines.append(score_row)
+                score_row.append(f" {'--':^10} |")
+        lines.append("".join(score_row))
 
-    lines.append("")
-    lines.append("↑ = 越高越好 (benefit)  ↓ = 越低越好 (cost)")
-    lines.append("=" * 70)
-
-    return "\n".join(lines)
+    lines.extend((
+        "",
+        "↑ = 越高越好 (benefit)  ↓ = 越低越好 (cost)",
+        _RULE
+    ))
 
 
 def generate_full_report(decision_id: str) -> str:
@@ -123,34 +156,36 @@ def generate_full_report(decision_id: str) -> str:
     Returns:
         完整决策报告
     """
-    if decision_id not in DECISION_STORE:
+    decision = DECISION_STORE.get(decision_id)
+    if decision is None:
         return f"❌ 未找到决策: {decision_id}"
 
-    decision = DECISION_STORE[decision_id]
-
     lines = []
 
     # 封面
-    lines.append("╔" + "═" * 68 + "╗")
-    lines.append("║" + "📋 决策分析报告".center(64) + "║")
-    lines.append("║" + f"{decision.get('title', '未命名决策')}".center(66) + "║")
-    lines.append("║" + f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M')}".center(60) + "║")
-    lines.append("╚" + "═" * 68 + "╝")
-    lines.append("")
+    lines.extend((
+        _COVER_TOP,
+        _COVER_HEADING,
+        "║" + f"{decision.get('title', '未命名决策')}".center(66) + "║",
+        "║" + f"生成时间: {_now_str()}".center(60) + "║",
+        _COVER_BOTTOM,
+        ""
+    ))
 
     # 1. 决策概述
-    lines.append("## 1. 决策概述")
-    lines.append("")
-    lines.append(f"**决策问题**: {decision.get('title', 'N/A')}")
-    lines.append(f"**描述**: {decision.get('description', '无')}")
-    lines.append(f"**截止日期**: {decision.get('deadline', '未设置')}")
-    lines.append(f"**利益相关者**: {', '.join(decision.get('stakeholders', [])) or '未设置'}")
-    lines.append(f"**状态**: {decision.get('status', 'draft')}")
-    lines.append("")
+    lines.extend((
+        "## 1. 决策概述",
+        "",
+        f"**决策问题**: {decision.get('title', 'N/A')}",
+        f"**描述**: {decision.get('description', '无')}",
+        f"**截止日期**: {decision.get('deadline', '未设置')}",
+        f"**利益相关者**: {', '.join(decision.get('stakeholders', [])) or '未设置'}",
+        f"**状态**: {decision.get('status', 'draft')}",
+        ""
+    ))
 
     # 2. 选项概述
-    lines.append("## 2. 决策选项")
-    lines.append("")
+    lines.extend(("## 2. 决策选项", ""))
     options = decision.get("options", [])
     for i, opt in enumerate(options, 1):
         lines.append(f"### 选项 {i}: {opt.get('name', 'N/A')}")
@@ -167,84 +202,76 @@ def generate_full_report(decision_id: str) -> str:
         lines.append("")
 
     # 3. 评估标准
-    lines.append("## 3. 评估标准")
-    lines.append("")
     criteria = decision.get("criteria", [])
-    lines.append("| 标准 | 权重 | 类型 |")
-    lines.append("|------|------|------|")
-    for c in criteria:
-        type_name = "正向(越高越好)" if c.get("type") == "benefit" else "负向(越低越好)"
-        lines.append(f"| {c['name']} | {c['weight']:.2f} | {type_name} |")
+    lines.extend(("## 3. 评估标准", "", "| 标准 | 权重 | 类型 |", "|------|------|------|"))
+    lines.extend(
+        f"| {c['name']} | {c['weight']:.2f} | {'正向(越高越好)' if c.get('type') == 'benefit' else '负向(越低越好)'} |"
+        for c in criteria
+    )
     lines.append("")
 
-    # 4. 决策矩阵
-    lines.append("## 4. 决策矩阵")
-    lines.append("")
-    lines.append(generate_decision_matrix(decision_id))
+    # 4. 决策矩阵（直接写入同一缓冲区）
+    lines.extend(("## 4. 决策矩阵", ""))
+    _append_decision_matrix(lines, decision_id, decision)
     lines.append("")
 
     # 5. 排名结果
-    lines.append("## 5. 排名结果")
-    lines.append("")
+    lines.extend(("## 5. 排名结果", ""))
     ranking = rank_options(decision_id)
     if ranking.get("status") == "success":
+        # 每个名次的得分行与得分条合为一个字符串（含换行），最终 join 结果不变
         for r in ranking.get("rankings", []):
-            medal = ["🥇", "🥈", "🥉"][r["rank"]-1] if r["rank"] <= 3 else f"{r['rank']}."
-            lines.append(f"{medal} {r['option_name']}: {r['score']:.1f}分")
-            lines.append(f"   {r['score_bar']}")
+            rank = r["rank"]
+            medal = _MEDALS[rank - 1] if rank <= 3 else f"{rank}."
+            lines.append(f"{medal} {r['option_name']}: {r['score']:.1f}分\n   {r['score_bar']}")
         lines.append("")
 
     # 6. 风险评估
-    lines.append("## 6. 风险评估")
-    lines.append("")
+    lines.extend(("## 6. 风险评估", ""))
     risk = risk_assessment(decision_id)
     if risk.get("status") == "success":
         for assessment in risk.get("assessments", []):
-            lines.append(f"**{assessment['option_name']}**: {assessment['overall_emoji']} {assessment['overall_level']} (风险得分: {assessment['overall_risk_score']})")
-            lines.append(f"  建议: {assessment['recommendation']}")
+            lines.extend((
+                f"**{assessment['option_name']}**: {assessment['overall_emoji']} {assessment['overall_level']} (风险得分: {assessment['overall_risk_score']})",
+                f"  建议: {assessment['recommendation']}"
+            ))
         lines.append("")
     else:
-        lines.append("  风险评估不可用")
-        lines.append("")
+        lines.extend(("  风险评估不可用", ""))
 
     # 7. 优劣势对比
-    lines.append("## 7. 优劣势对比")
-    lines.append("")
+    lines.extend(("## 7. 优劣势对比", ""))
     pros_cons = pros_cons_analysis(decision_id)
     if pros_cons.get("status") == "success":
         for analysis in pros_cons.get("analysis", []):
             lines.append(f"### {analysis['option_name']} ({analysis['balance']})")
             if analysis.get("strengths"):
                 lines.append("  ✅ 优势:")
-                for s in analysis["strengths"]:
-                    lines.append(f"    - {s['criterion']}: {s['score']}/10 ({s['note']})")
+                lines.extend(f"    - {s['criterion']}: {s['score']}/10 ({s['note']})" for s in analysis["strengths"])
             if analysis.get("weaknesses"):
                 lines.append("  ❌ 劣势:")
-                for w in analysis["weaknesses"]:
-                    lines.append(f"    - {w['criterion']}: {w['score']}/10 ({w['note']})")
+                lines.extend(f"    - {w['criterion']}: {w['score']}/10 ({w['note']})" for w in analysis["weaknesses"])
             lines.append("")
 
     # 8. 建议
-    lines.append("## 8. 决策建议")
-    lines.append("")
+    lines.extend(("## 8. 决策建议", ""))
     recommendation = get_recommendation(decision_id)
     if recommendation.get("status") == "success":
         rec = recommendation.get("recommendation", {})
-        lines.append(f"**推荐选择**: {rec.get('confidence_emoji', '')} {rec.get('choice', 'N/A')}")
-        lines.append(f"**得分**: {rec.get('score', 0):.1f}/100")
-        lines.append(f"**置信度**: {rec.get('confidence', 'N/A')}")
-        lines.append(f"**建议**: {rec.get('advice', 'N/A')}")
+        lines.extend((
+            f"**推荐选择**: {rec.get('confidence_emoji', '')} {rec.get('choice', 'N/A')}",
+            f"**得分**: {rec.get('score', 0):.1f}/100",
+            f"**置信度**: {rec.get('confidence', 'N/A')}",
+            f"**建议**: {rec.get('advice', 'N/A')}"
+        ))
 
         comp = recommendation.get("comparison", {})
         if comp.get("runner_up"):
-            lines.append("")
-            lines.append(f"与第二名「{comp['runner_up']}」相差 {comp['score_gap']} 分")
+            lines.extend(("", f"与第二名「{comp['runner_up']}」相差 {comp['score_gap']} 分"))
     else:
         lines.append("  建议不可用，请确保完成评分")
 
-    lines.append("")
-    lines.append("=" * 70)
-    lines.append("报告结束")
+    lines.extend(("", _RULE, "报告结束"))
 
     return "\n".join(lines)
 
@@ -259,16 +286,16 @@ def generate_executive_summary(decision_id: str) -> str:
     Returns:
         执行摘要
     """
-    if decision_id not in DECISION_STORE:
+    decision = DECISION_STORE.get(decision_id)
+    if decision is None:
         return f"❌ 未找到决策: {decision_id}"
 
-    decision = DECISION_STORE[decision_id]
     recommendation = get_recommendation(decision_id)
 
     lines = []
-    lines.append("┌" + "─" * 58 + "┐")
-    lines.append("│" + "📋 执行摘要".center(54) + "│")
-    lines.append("├" + "─" * 58 + "┤")
+    lines.append(_SUMMARY_TOP)
+    lines.append(_SUMMARY_HEADING)
+    lines.append(_SUMMARY_DIVIDER)
 
     # 决策问题
     title = decision.get("title", "未命名决策")[:40]
@@ -285,18 +312,18 @@ def generate_executive_summary(decision_id: str) -> str:
         score = rec.get("score", 0)
         confidence = rec.get("confidence_emoji", "")
 
-        lines.append("├" + "─" * 58 + "┤")
+        lines.append(_SUMMARY_DIVIDER)
         lines.append(f"│ {confidence} 推荐选择: {choice:36} │")
         lines.append(f"│ 综合得分: {score:.1f}/100{' '*41}│")
         lines.append(f"│ 置信度: {rec.get('confidence', 'N/A')}{' '*45}│"[:61] + "│")
 
         # 关键理由
-        lines.append("├" + "─" * 58 + "┤")
+        lines.append(_SUMMARY_DIVIDER)
         lines.append(f"│ 结论: {rec.get('advice', 'N/A')[:50]:50} │")
     else:
-        lines.append("├" + "─" * 58 + "┤")
+        lines.append(_SUMMARY_DIVIDER)
         lines.append("│ ⚠️  评分未完成，无法生成建议                              │")
 
-    lines.append("└" + "─" * 58 + "┘")
+    lines.append(_SUMMARY_BOTTOM)
 
     return "\n".join(lines)
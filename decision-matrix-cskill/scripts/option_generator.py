@@ -3,9 +3,73 @@ Option Generator Module - 选项生成模块
 管理决策选项
 """
 
-from datetime import datetime
 from typing import Dict, List, Optional
-from .decision_framer import DECISION_STORE
+from types import MappingProxyType
+from .decision_framer import _OPTIONS_STATE, _get_decision, _now_str, _options_state, _touch
+
+
+# 选项模板
+OPTION_TEMPLATES = {
+    "investment": [
+        {"name": "保守投资", "description": "低风险固定收益产品"},
+        {"name": "平衡投资", "description": "股债均衡配置"},
+        {"name": "激进投资", "description": "高比例权益资产"},
+        {"name": "另类投资", "description": "房产/私募/加密货币"}
+    ],
+    "hiring": [
+        {"name": "候选人A", "description": "经验丰富的行业专家"},
+        {"name": "候选人B", "description": "潜力新人，性价比高"},
+        {"name": "候选人C", "description": "跨界人才，创新思维"},
+        {"name": "暂不招聘", "description": "内部培养或外包"}
+    ],
+    "vendor": [
+        {"name": "供应商A", "description": "行业领先，价格较高"},
+        {"name": "供应商B", "description": "性价比优，服务一般"},
+        {"name": "供应商C", "description": "新兴企业，创新方案"},
+        {"name": "自建团队", "description": "内部开发/生产"}
+    ],
+    "strategy": [
+        {"name": "扩张战略", "description": "积极扩大市场份额"},
+        {"name": "专注战略", "description": "深耕核心业务"},
+        {"name": "多元化战略", "description": "进入新市场/新业务"},
+        {"name": "防守战略", "description": "降本增效，稳健经营"}
+    ],
+    "product": [
+        {"name": "功能A", "description": "用户强需求，开发成本高"},
+        {"name": "功能B", "description": "差异化卖点，技术挑战"},
+        {"name": "功能C", "description": "快速实现，用户价值中等"},
+        {"name": "暂不开发", "description": "观察市场，积累资源"}
+    ]
+}
+
+# 模板在模块加载时冻结为只读结构；返回建议时逐项复制，调用方修改建议不会影响模板
+OPTION_TEMPLATES = MappingProxyType({
+    key: tuple(MappingProxyType(s) for s in suggestions)
+    for key, suggestions in OPTION_TEMPLATES.items()
+})
+
+
+def _make_option(
+    option_id: str,
+    name: str,
+    now: str,
+    description: str = "",
+    pros: List[str] = None,
+    cons: List[str] = None,
+    estimated_cost: str = None,
+    estimated_time: str = None
+) -> Dict:
+    """构造选项字典（add_option 与 add_quick_options 共用）"""
+    return {
+        "id": option_id,
+        "name": name,
+        "description": description,
+        "pros": pros or [],
+        "cons": cons or [],
+        "estimated_cost": estimated_cost,
+        "estimated_time": estimated_time,
+        "added_at": now
+    }
 
 
 def add_option(
@@ -32,30 +96,22 @@ def add_option(
     Returns:
         添加结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    decision = DECISION_STORE[decision_id]
+    state = _options_state(decision)
+    now = _now_str()
 
     # 生成选项ID
     option_id = f"opt_{len(decision['options']) + 1}"
 
-    option = {
-        "id": option_id,
-        "name": name,
-        "description": description,
-        "pros": pros or [],
-        "cons": cons or [],
-        "estimated_cost": estimated_cost,
-        "estimated_time": estimated_time,
-        "added_at": datetime.now().strftime("%Y-%m-%d %H:%M")
-    }
+    option = _make_option(option_id, name, now, description, pros, cons, estimated_cost, estimated_time)
 
     decision["options"].append(option)
-    decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    state.index.setdefault(option_id, option)
+    state.count += 1
+    _touch(decision, now)
 
     return {
         "status": "success",
@@ -76,32 +132,33 @@ def remove_option(decision_id: str, option_id: str) -> Dict:
     Returns:
         移除结果
     """
-    if decision_id not in DECISION_STORE:
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
+
+    removed = _options_state(decision).index.get(option_id)
+    if removed is None:
         return {
             "status": "error",
-            "message": f"未找到决策: {decision_id}"
+            "message": f"未找到选项: {option_id}"
         }
 
-    decision = DECISION_STORE[decision_id]
-    options = decision.get("options", [])
-
+    options = decision["options"]
     for i, opt in enumerate(options):
-        if opt["id"] == option_id:
-            removed = options.pop(i)
-            decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-            # 同时删除相关评分
-            if option_id in decision.get("scores", {}):
-                del decision["scores"][option_id]
+        if opt is removed:
+            options.pop(i)
+            break
+    # 可能存在同ID的其他选项，索引下次访问时重建
+    _OPTIONS_STATE.pop(decision_id, None)
+    _touch(decision)
 
-            return {
-                "status": "success",
-                "message": f"选项 '{removed['name']}' 已移除"
-            }
+    # 同时删除相关评分
+    if option_id in decision.get("scores", {}):
+        del decision["scores"][option_id]
 
     return {
-        "status": "error",
-        "message": f"未找到选项: {option_id}"
+        "status": "success",
+        "message": f"选项 '{removed['name']}' 已移除"
     }
 
 
@@ -115,13 +172,10 @@ def get_options(decision_id: str) -> Dict:
     Returns:
         选项列表
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    decision = DECISION_STORE[decision_id]
     options = decision.get("options", [])
 
     return {
@@ -144,30 +198,25 @@ def update_option(decision_id: str, option_id: str, updates: Dict) -> Dict:
     Returns:
         更新结果
     """
-    if decision_id not in DECISION_STORE:
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
+
+    opt = _options_state(decision).index.get(option_id)
+    if opt is None:
         return {
             "status": "error",
-            "message": f"未找到决策: {decision_id}"
+            "message": f"未找到选项: {option_id}"
         }
 
-    decision = DECISION_STORE[decision_id]
-    options = decision.get("options", [])
-
-    for opt in options:
-        if opt["id"] == option_id:
-            for key, value in updates.items():
-                if key != "id":
-                    opt[key] = value
-            decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-            return {
-                "status": "success",
-                "message": "选项已更新",
-                "option": opt
-            }
-
+    for key, value in updates.items():
+        if key != "id":
+            opt[key] = value
+    _touch(decision)
     return {
-        "status": "error",
-        "message": f"未找到选项: {option_id}"
+        "status": "success",
+        "message": "选项已更新",
+        "option": opt
     }
 
 
@@ -182,52 +231,19 @@ def generate_options_from_template(decision_id: str, template_type: str) -> Dict
     Returns:
         生成的选项建议
     """
-    option_templates = {
-        "investment": [
-            {"name": "保守投资", "description": "低风险固定收益产品"},
-            {"name": "平衡投资", "description": "股债均衡配置"},
-            {"name": "激进投资", "description": "高比例权益资产"},
-            {"name": "另类投资", "description": "房产/私募/加密货币"}
-        ],
-        "hiring": [
-            {"name": "候选人A", "description": "经验丰富的行业专家"},
-            {"name": "候选人B", "description": "潜力新人，性价比高"},
-            {"name": "候选人C", "description": "跨界人才，创新思维"},
-            {"name": "暂不招聘", "description": "内部培养或外包"}
-        ],
-        "vendor": [
-            {"name": "供应商A", "description": "行业领先，价格较高"},
-            {"name": "供应商B", "description": "性价比优，服务一般"},
-            {"name": "供应商C", "description": "新兴企业，创新方案"},
-            {"name": "自建团队", "description": "内部开发/生产"}
-        ],
-        "strategy": [
-            {"name": "扩张战略", "description": "积极扩大市场份额"},
-            {"name": "专注战略", "description": "深耕核心业务"},
-            {"name": "多元化战略", "description": "进入新市场/新业务"},
-            {"name": "防守战略", "description": "降本增效，稳健经营"}
-        ],
-        "product": [
-            {"name": "功能A", "description": "用户强需求，开发成本高"},
-            {"name": "功能B", "description": "差异化卖点，技术挑战"},
-            {"name": "功能C", "description": "快速实现，用户价值中等"},
-            {"name": "暂不开发", "description": "观察市场，积累资源"}
-        ]
-    }
-
-    suggestions = option_templates.get(template_type, [])
+    template = OPTION_TEMPLATES.get(template_type)
 
-    if not suggestions:
+    if not template:
         return {
             "status": "error",
             "message": f"未找到模板: {template_type}",
-            "available_templates": list(option_templates.keys())
+            "available_templates": list(OPTION_TEMPLATES.keys())
         }
 
     return {
         "status": "success",
         "template": template_type,
-        "suggestions": suggestions,
+        "suggestions": [dict(s) for s in template],
         "note": "这些是建议选项，请根据实际情况调整"
     }
 
@@ -243,19 +259,36 @@ def add_quick_options(decision_id: str, option_names: List[str]) -> Dict:
     Returns:
         添加结果
     """
-    results = []
-    for name in option_names:
-        result = add_option(decision_id, name)
-        results.append({
-            "name": name,
-            "success": result.get("status") == "success"
-        })
+    decision, error = _get_decision(decision_id)
+    if error:
+        return {
+            "status": "success",
+            "added_count": 0,
+            "total_requested": len(option_names),
+            "results": [{"name": name, "success": False} for name in option_names]
+        }
 
-    success_count = sum(1 for r in results if r["success"])
+    # 决策只查一次、时间只取一次，整批构造后一次性追加
+    state = _options_state(decision)
+    options = decision["options"]
+    now = _now_str()
+    base = len(options)
+
+    new_options = [
+        _make_option(f"opt_{base + i}", name, now)
+        for i, name in enumerate(option_names, 1)
+    ]
+    if new_options:
+        options.extend(new_options)
+        index = state.index
+        for option in new_options:
+            index.setdefault(option["id"], option)
+        state.count += len(new_options)
+        _touch(decision, now)
 
     return {
         "status": "success",
-        "added_count": success_count,
+        "added_count": len(new_options),
         "total_requested": len(option_names),
-        "results": results
+        "results": [{"name": name, "success": True} for name in option_names]
     }
@@ -3,9 +3,131 @@ Scoring Engine Module - 评分引擎模块
 计算加权得分和排名
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional
-from .decision_framer import DECISION_STORE
+from bisect import bisect_left
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+import heapq
+from .decision_framer import DECISION_STORE, _DECISION_VERSION, _get_decision, _options_state, _touch
+
+# 置信度档位：分差超过第 i 个分界即升至第 i+1 档，每档为 (置信度, 标识, 建议)
+_CONFIDENCE_GAP_EDGES = (5, 10, 20)
+_CONFIDENCE_TIERS = (
+    ("低", "🔴", "选项非常接近，需要更多信息"),
+    ("中等", "🟠", "两个选项接近，需要权衡"),
+    ("中高", "🟡", "较好的选择，但可再考虑"),
+    ("高", "🟢", "明显的最佳选择"),
+)
+
+# 20格得分条：第 n 项为 n 格实心 + (20-n) 格空心
+_SCORE_BARS = tuple("█" * n + "░" * (20 - n) for n in range(21))
+
+
+def _score_matrix(decision: Dict) -> Optional[Tuple[List[Dict], List[Tuple[str, str, List[Tuple[int, float]]]]]]:
+    """
+    将决策的评分整理为 (选项 × 标准) 的调整后得分矩阵，供批量权重评估复用
+
+    Args:
+        decision: 决策对象
+
+    Returns:
+        (criteria, rows)，rows 每行为 (选项ID, 选项名, [(标准下标, 调整后得分)])；
+        缺少选项/标准/评分时返回 None
+    """
+    options = decision.get("options", [])
+    criteria = decision.get("criteria", [])
+    scores = decision.get("scores", {})
+
+    if not options or not criteria or not scores:
+        return None
+
+    # 标准名 -> 下标（同名时以后者为准，与 criteria_map 一致）
+    crit_index = {c["name"]: i for i, c in enumerate(criteria)}
+    is_cost = [c.get("type", "benefit") == "cost" for c in criteria]
+
+    rows = []
+    for option in options:
+        opt_id = option["id"]
+        if opt_id not in scores:
+            continue
+
+        # 按评分字典顺序保留各项，保证累加顺序与逐项计算一致
+        row = []
+        for criterion_name, raw_score in scores[opt_id].items():
+            i = crit_index.get(criterion_name)
+            if i is None:
+                continue
+            row.append((i, 11 - raw_score if is_cost[i] else raw_score))
+        rows.append((opt_id, option["name"], row))
+
+    return criteria, rows
+
+
+@lru_cache(maxsize=64)
+def _cached_score_matrix(decision_id: str, version: int):
+    """按 (决策ID, 版本号) 缓存得分矩阵，决策被修改后版本号变化自动失效"""
+    return _score_matrix(DECISION_STORE[decision_id])
+
+
+def _decision_score_matrix(decision: Dict):
+    """
+    获取决策的得分矩阵，同一版本的决策在多次分析间复用
+    （结果会被缓存并在调用间共享，请勿修改返回值）
+
+    Args:
+        decision: 决策对象
+
+    Returns:
+        同 _score_matrix
+    """
+    decision_id = decision["id"]
+    return _cached_score_matrix(decision_id, _DECISION_VERSION.get(decision_id, -1))
+
+
+@lru_cache(maxsize=64)
+def _cached_criteria_layout(decision_id: str, version: int) -> Dict[str, Tuple[int, bool]]:
+    """按 (决策ID, 版本号) 缓存 标准名 -> (下标, 是否cost类型)，决策被修改后版本号变化自动失效"""
+    criteria = DECISION_STORE[decision_id].get("criteria", [])
+    return {c["name"]: (i, c.get("type", "benefit") == "cost") for i, c in enumerate(criteria)}
+
+
+def _score_bar(normalized_score: float) -> str:
+    """百分制得分对应的得分条（每5分一格）"""
+    filled = int(normalized_score / 5)
+    if 0 <= filled <= 20:
+        return _SCORE_BARS[filled]
+    return "█" * filled + "░" * (20 - filled)
+
+
+def _rounded_total(item: Tuple[str, float]) -> float:
+    """排序键：加权和保留3位小数"""
+    return round(item[1], 3)
+
+
+def _rank_by_weights(rows: List[Tuple[str, str, List[Tuple[int, float]]]],
+                     weights: Sequence[float], top_k: Optional[int] = None) -> List[Tuple[str, float]]:
+    """
+    用给定权重向量对得分矩阵求加权和并排序（不读写决策存储）
+
+    Args:
+        rows: _score_matrix 返回的得分矩阵
+        weights: 与 criteria 顺序对齐的权重向量
+        top_k: 只需要前几名时传入，避免对全部选项排序
+
+    Returns:
+        按加权得分降序排列的 [(选项名, 加权和)]
+    """
+    totals = []
+    for _, opt_name, row in rows:
+        weighted_sum = 0
+        for i, adjusted_score in row:
+            weighted_sum += adjusted_score * weights[i]
+        totals.append((opt_name, weighted_sum))
+
+    # 与 calculate_weighted_scores 相同：按保留3位小数的得分稳定排序（nlargest 与 sorted 取前k等价）
+    if top_k is not None:
+        return heapq.nlargest(top_k, totals, key=_rounded_total)
+    return sorted(totals, key=_rounded_total, reverse=True)
 
 
 def score_option(
@@ -24,17 +146,12 @@ def score_option(
     Returns:
         评分结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
-
-    decision = DECISION_STORE[decision_id]
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
     # 验证选项存在
-    option_exists = any(o["id"] == option_id for o in decision.get("options", []))
-    if not option_exists:
+    if option_id not in _options_state(decision).index:
         return {
             "status": "error",
             "message": f"未找到选项: {option_id}"
@@ -52,8 +169,9 @@ def score_option(
     if "scores" not in decision:
         decision["scores"] = {}
 
-    decision["scores"][option_id] = scores
-    decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    # 保存副本：调用方之后修改传入的字典不会绕过 _touch 改动存储（派生缓存以修改版本号为键）
+    decision["scores"][option_id] = dict(scores)
+    _touch(decision)
 
     return {
         "status": "success",
@@ -73,13 +191,10 @@ def get_scores(decision_id: str, option_id: str = None) -> Dict:
     Returns:
         评分数据
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    decision = DECISION_STORE[decision_id]
     scores = decision.get("scores", {})
 
     if option_id:
@@ -102,23 +217,60 @@ def get_scores(decision_id: str, option_id: str = None) -> Dict:
     }
 
 
-def calculate_weighted_scores(decision_id: str) -> Dict:
+def _copy_result_row(row: Dict) -> Dict:
+    """复制一条得分结果（含逐项得分明细）"""
+    row = dict(row)
+    if "score_details" in row:
+        row["score_details"] = [dict(detail) for detail in row["score_details"]]
+    return row
+
+
+def calculate_weighted_scores(
+    decision_id: str,
+    weights_override: Optional[Sequence[float]] = None,
+    top_k: Optional[int] = None,
+    include_details: bool = True
+) -> Dict:
     """
-    计算加权得分
+    计算加权得分（未提供 weights_override 时，结果按决策修改版本缓存，返回结果字典、各结果行及其得分明细的副本）
 
     Args:
         decision_id: 决策ID
+        weights_override: 临时权重向量（与标准顺序对齐，可选），提供时代替标准中存储的权重，
+            用于假设分析而不修改决策
+        top_k: 只返回得分最高的前几个选项（可选），不提供则返回全部排名
+        include_details: 是否为每个选项附带逐项得分明细 score_details（只需总分时传 False）
 
     Returns:
         加权得分结果
     """
-    if decision_id not in DECISION_STORE:
-        return {
-            "status": "error",
-            "message": f"未找到决策: {decision_id}"
-        }
+    if weights_override is None:
+        cached = _cached_weighted_scores(decision_id, _DECISION_VERSION.get(decision_id, -1), top_k, include_details)
+        if "results" not in cached:
+            return dict(cached)
+        # 逐层复制结果行及其得分明细，调用方修改返回值不会影响缓存
+        results = [_copy_result_row(row) for row in cached["results"]]
+        return dict(cached, results=results, winner=results[0] if results else None)
+    return _compute_weighted_scores(decision_id, weights_override, top_k, include_details)
+
+
+@lru_cache(maxsize=128)
+def _cached_weighted_scores(decision_id: str, version: int, top_k: Optional[int], include_details: bool) -> Dict:
+    """按 (决策ID, 版本号, top_k, include_details) 缓存加权得分，决策被修改后版本号变化自动失效"""
+    return _compute_weighted_scores(decision_id, None, top_k, include_details)
+
+
+def _compute_weighted_scores(
+    decision_id: str,
+    weights_override: Optional[Sequence[float]],
+    top_k: Optional[int],
+    include_details: bool
+) -> Dict:
+    """calculate_weighted_scores 的计算主体（不经缓存）"""
+    decision, error = _get_decision(decision_id)
+    if error:
+        return error
 
-    decision = DECISION_STORE[decision_id]
     options = decision.get("options", [])
     criteria = decision.get("criteria", [])
     scores = decision.get("scores", {})
@@ -129,36 +281,55 @@ def calculate_weighted_scores(decision_id: str) -> Dict:
         return {"status": "error", "message": "没有评估标准"}
     if not scores:
         return {"status": "error", "message": "没有评分数据"}
+    if weights_override is not None and len(weights_override) != len(criteria):
+        return {"status": "error", "message": "权重向量长度与标准数量不一致"}
+
+    if weights_override is not None:
+        weights = weights_override
+    else:
+        weights = [c.get("weight", 0) for c in criteria]
 
-    # 构建标准权重和类型映射
-    criteria_map = {c["name"]: c for c in criteria}
+    # 标准名 -> (下标, 是否cost类型) 只与标准列表有关，同一版本的决策在多次调用间复用
+    layout_get = _cached_criteria_layout(decision_id, _DECISION_VERSION.get(decision_id, -1)).get
 
     results = []
+    scores_get = scores.get
 
     for option in options:
-        opt_id = option["id"]
-        opt_name = option["name"]
-
-        if opt_id not in scores:
+        opt_scores = scores_get(option["id"])
+        if opt_scores is None:
             continue
 
-        opt_scores = scores[opt_id]
         weighted_sum = 0
+
+        if not include_details:
+            # 只累计总分，不构造明细
+            for criterion_name, raw_score in opt_scores.items():
+                info = layout_get(criterion_name)
+                if info is not None:
+                    i, is_cost = info
+                    weighted_sum += (11 - raw_score if is_cost else raw_score) * weights[i]
+
+            results.append({
+                "option_id": option["id"],
+                "option_name": option["name"],
+                "weighted_score": round(weighted_sum, 3),
+                "normalized_score": round(weighted_sum / 10 * 100, 1)
+            })
+            continue
+
         score_details = []
 
         for criterion_name, raw_score in opt_scores.items():
-            if criterion_name not in criteria_map:
+            info = layout_get(criterion_name)
+            if info is None:
                 continue
 
-            criterion = criteria_map[criterion_name]
-            weight = criterion.get("weight", 0)
-            crit_type = criterion.get("type", "benefit")
+            i, is_cost = info
+            weight = weights[i]
 
             # 对于cost类型，分数反转（10变1，1变10）
-            if crit_type == "cost":
-                adjusted_score = 11 - raw_score
-            else:
-                adjusted_score = raw_score
+            adjusted_score = 11 - raw_score if is_cost else raw_score
 
             weighted_score = adjusted_score * weight
             weighted_sum += weighted_score
@@ -172,15 +343,18 @@ def calculate_weighted_scores(decision_id: str) -> Dict:
             })
 
         results.append({
-            "option_id": opt_id,
-            "option_name": opt_name,
+            "option_id": option["id"],
+            "option_name": option["name"],
             "weighted_score": round(weighted_sum, 3),
             "normalized_score": round(weighted_sum / 10 * 100, 1),  # 转换为百分制
             "score_details": score_details
         })
 
-    # 按加权得分排序
-    results = sorted(results, key=lambda x: x["weighted_score"], reverse=True)
+    # 按加权得分排序（只要前k名时用堆选取，避免全量排序）
+    if top_k is not None:
+        results = heapq.nlargest(top_k, results, key=itemgetter("weighted_score"))
+    else:
+        results = sorted(results, key=itemgetter("weighted_score"), reverse=True)
 
     return {
         "status": "success",
@@ -200,7 +374,7 @@ def rank_options(decision_id: str) -> Dict:
     Returns:
         排名结果
     """
-    weighted = calculate_weighted_scores(decision_id)
+    weighted = calculate_weighted_scores(decision_id, include_details=False)
 
     if weighted.get("status") != "success":
         return weighted
@@ -213,7 +387,7 @@ def rank_options(decision_id: str) -> Dict:
             "rank": i,
             "option_name": result["option_name"],
             "score": result["normalized_score"],
-            "score_bar": "█" * int(result["normalized_score"] / 5) + "░" * (20 - int(result["normalized_score"] / 5))
+            "score_bar": _score_bar(result["normalized_score"])
         })
 
     return {
@@ -235,7 +409,7 @@ def get_recommendation(decision_id: str) -> Dict:
     Returns:
         决策建议
     """
-    weighted = calculate_weighted_scores(decision_id)
+    weighted = calculate_weighted_scores(decision_id, include_details=False)
 
     if weighted.get("status") != "success":
         return weighted
@@ -254,22 +428,8 @@ def get_recommendation(decision_id: str) -> Dict:
     # 计算置信度
     if runner_up:
         score_gap = winner["normalized_score"] - runner_up["normalized_score"]
-        if score_gap > 20:
-            confidence = "高"
-            confidence_emoji = "🟢"
-            advice = "明显的最佳选择"
-        elif score_gap > 10:
-            confidence = "中高"
-            confidence_emoji = "🟡"
-            advice = "较好的选择，但可再考虑"
-        elif score_gap > 5:
-            confidence = "中等"
-            confidence_emoji = "🟠"
-            advice = "两个选项接近，需要权衡"
-        else:
-            confidence = "低"
-            confidence_emoji = "🔴"
-            advice = "选项非常接近，需要更多信息"
+        # 分界为严格大于，故用 bisect_left（恰好等于分界时留在低一档）
+        confidence, confidence_emoji, advice = _CONFIDENCE_TIERS[bisect_left(_CONFIDENCE_GAP_EDGES, score_gap)]
     else:
         confidence = "仅有一个选项"
         confidence_emoji = "⚪"
@@ -305,6 +465,6 @@ def get_recommendation(decision_id: str) -> Dict:
     if decision:
         decision["recommendation"] = recommendation["recommendation"]
         decision["status"] = "completed"
-        decision["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+        _touch(decision)
 
     return recommendation
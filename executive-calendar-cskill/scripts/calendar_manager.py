@@ -3,14 +3,175 @@ Calendar Manager Module - 日历管理模块
 日程管理、冲突检测、空闲时段查找
 """
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 # 模拟日历存储
 CALENDAR_STORE = {
     "events": []
 }
 
+# 日历修改版本号（每次增删改事件时递增），与事件列表的身份、长度一起用作查询缓存的失效标记
+_CALENDAR_VERSION = [0]
+
+
+def _touch_calendar() -> None:
+    """记录日历被修改：递增版本号（所有修改事件的接口都应调用）"""
+    _CALENDAR_VERSION[0] += 1
+
+
+def _calendar_stamp() -> Tuple[int, int, int]:
+    """当前日历状态的缓存键：(版本号, 事件列表身份, 事件数)，整体替换或直接追加事件列表也会使其变化"""
+    events = CALENDAR_STORE["events"]
+    return _CALENDAR_VERSION[0], id(events), len(events)
+
+
+@lru_cache(maxsize=2048)
+def _to_minutes(hhmm: str) -> int:
+    """将 "HH:MM" 转换为当天的分钟数（一天内的时刻有限，解析结果按字符串缓存）"""
+    parts = hhmm.split(":")
+    return int(parts[0]) * 60 + int(parts[1])
+
+
+class _DaySchedule:
+    """
+    单日的冲突查询结构：事件按开始时间排序，并记录每个前缀内的最大结束时间
+    （即区间树的 max 增强以有序数组表示），重叠查询只需回溯可能重叠的前缀
+    """
+
+    __slots__ = ("starts", "max_ends", "entries")
+
+    def __init__(self):
+        self.starts: List[int] = []
+        self.max_ends: List[int] = []
+        self.entries: List[Tuple[int, int, Dict]] = []  # (结束分钟, 存储顺序, 事件)
+
+    def add(self, start_min: int, end_min: int, seq: int, event: Dict) -> None:
+        """按开始时间插入事件，并从插入位置起更新前缀最大结束时间"""
+        i = bisect_left(self.starts, start_min)
+        self.starts.insert(i, start_min)
+        self.entries.insert(i, (end_min, seq, event))
+
+        max_ends = self.max_ends
+        max_ends.insert(i, 0)
+        running = max_ends[i - 1] if i else end_min
+        for j in range(i, len(max_ends)):
+            e_end = self.entries[j][0]
+            if e_end > running:
+                running = e_end
+            max_ends[j] = running
+
+    def overlapping(self, start_min: int, end_min: int, exclude: Optional[Dict] = None) -> List[Dict]:
+        """
+        查询与 [start_min, end_min) 重叠的事件
+
+        Args:
+            start_min: 开始分钟
+            end_min: 结束分钟
+            exclude: 不参与比较的事件（如正在修改的事件本身）
+
+        Returns:
+            重叠的事件，按在存储中的顺序排列
+        """
+        hits = []
+        # 只有开始时间早于 end_min 的事件可能重叠；从后向前回溯，前缀最大结束时间不超过 start_min 时即可停止
+        for i in range(bisect_left(self.starts, end_min) - 1, -1, -1):
+            if self.max_ends[i] <= start_min:
+                break
+            e_end, seq, event = self.entries[i]
+            if e_end > start_min and event is not exclude:
+                hits.append((seq, event))
+        hits.sort(key=lambda h: h[0])
+        return [event for _, event in hits]
+
+
+class _EventIndex:
+    """
+    日程的按日期索引：每个日期的事件列表（保持存储顺序）及冲突查询结构，
+    由 add_event 增量维护；删除、修改事件或替换事件列表后重建
+    """
+
+    __slots__ = ("events", "count", "by_date", "days")
+
+    def __init__(self, events: List[Dict]):
+        self.events = events
+        self.count = 0
+        self.by_date: Dict[str, List[Dict]] = {}
+        self.days: Dict[str, _DaySchedule] = {}
+        for event in events:
+            self.add(event)
+
+    def add(self, event: Dict) -> None:
+        """登记一个已追加到事件列表末尾的事件"""
+        date = event.get("date")
+        day = self.days.get(date)
+        if day is None:
+            day = self.days[date] = _DaySchedule()
+            self.by_date[date] = []
+        self.by_date[date].append(event)
+        day.add(_to_minutes(event.get("start", "00:00")), _to_minutes(event.get("end", "00:00")), self.count, event)
+        self.count += 1
+
+
+# 事件索引（单元素列表便于整体替换），由 _event_index 维护
+_EVENT_INDEX: List[Optional[_EventIndex]] = [None]
+
+
+def _event_index() -> _EventIndex:
+    """
+    获取当前事件列表的按日期索引
+
+    事件列表被整体替换（如 clear_calendar）或长度与记录不符时自动重建；
+    直接修改事件字典中的日期/时间不会被察觉，修改后需调用 _invalidate_event_index
+
+    Returns:
+        事件索引
+    """
+    events = CALENDAR_STORE["events"]
+    index = _EVENT_INDEX[0]
+    if index is None or index.events is not events or index.count != len(events):
+        index = _EVENT_INDEX[0] = _EventIndex(events)
+    return index
+
+
+def _invalidate_event_index() -> None:
+    """丢弃事件索引，下次查询时重建"""
+    _EVENT_INDEX[0] = None
+
+
+def _events_on(date: str) -> List[Dict]:
+    """
+    获取某日的全部事件（按存储顺序，调用前需已初始化日历）
+
+    Args:
+        date: 日期
+
+    Returns:
+        当天事件列表（索引内部列表，只读）
+    """
+    return _event_index().by_date.get(date, [])
+
+
+def _find_conflicts(date: str, start: str, end: str, exclude: Optional[Dict] = None) -> List[Dict]:
+    """
+    查找与给定时段重叠的事件（调用前需已初始化日历）
+
+    Args:
+        date: 日期
+        start: 开始时间
+        end: 结束时间
+        exclude: 不参与比较的事件
+
+    Returns:
+        重叠的事件，按在存储中的顺序排列
+    """
+    day = _event_index().days.get(date)
+    if day is None:
+        return []
+    return day.overlapping(_to_minutes(start), _to_minutes(end), exclude)
+
 # 示例日程数据
 SAMPLE_EVENTS = [
     {
@@ -63,6 +224,7 @@ def initialize_calendar():
     """初始化日历数据"""
     if not CALENDAR_STORE["events"]:
         CALENDAR_STORE["events"] = SAMPLE_EVENTS.copy()
+        _touch_calendar()
 
 
 def add_event(
@@ -122,7 +284,10 @@ def add_event(
         "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
 
+    index = _event_index()
     CALENDAR_STORE["events"].append(event)
+    index.add(event)
+    _touch_calendar()
 
     return {
         "status": "success",
@@ -134,14 +299,22 @@ def add_event(
 def get_today_agenda() -> Dict:
     """
     获取今日日程
+    （结果按日历修改版本缓存，返回结果字典与事件列表的副本；列表中的事件即日历存储中的事件对象）
 
     Returns:
         今日日程列表
     """
     initialize_calendar()
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    today_events = [e for e in CALENDAR_STORE["events"] if e.get("date") == today]
+    agenda = dict(_cached_today_agenda(datetime.now().strftime("%Y-%m-%d"), _calendar_stamp()))
+    agenda["events"] = list(agenda["events"])
+    return agenda
+
+
+@lru_cache(maxsize=8)
+def _cached_today_agenda(today: str, stamp: Tuple[int, int, int]) -> Dict:
+    """按 (日期, 日历状态) 缓存今日日程，日历被修改或跨天后自动失效"""
+    today_events = _events_on(today)
 
     # 按开始时间排序
     sorted_events = sorted(today_events, key=lambda x: x.get("start", "00:00"))
@@ -151,14 +324,14 @@ def get_today_agenda() -> Dict:
     for e in sorted_events:
         start = e.get("start", "00:00")
         end = e.get("end", "00:00")
-        start_min = int(start.split(":")[0]) * 60 + int(start.split(":")[1])
-        end_min = int(end.split(":")[0]) * 60 + int(end.split(":")[1])
+        start_min = _to_minutes(start)
+        end_min = _to_minutes(end)
         total_minutes += (end_min - start_min)
 
     return {
         "status": "success",
         "date": today,
-        "date_formatted": datetime.now().strftime("%Y年%m月%d日 %A"),
+        "date_formatted": datetime.strptime(today, "%Y-%m-%d").strftime("%Y年%m月%d日 %A"),
         "event_count": len(sorted_events),
         "total_hours": round(total_minutes / 60, 1),
         "events": sorted_events,
@@ -170,6 +343,7 @@ def get_today_agenda() -> Dict:
 def get_week_agenda(start_date: str = None) -> Dict:
     """
     获取本周日程
+    （结果按日历修改版本缓存，返回结果字典、每日统计及各日事件列表的副本；列表中的事件即日历存储中的事件对象）
 
     Args:
         start_date: 起始日期，默认为今天
@@ -186,6 +360,16 @@ def get_week_agenda(start_date: str = None) -> Dict:
 
     # 计算本周范围
     week_start = start - timedelta(days=start.weekday())
+    week = dict(_cached_week_agenda(week_start.strftime("%Y-%m-%d"), _calendar_stamp()))
+    week["daily_breakdown"] = [dict(day) for day in week["daily_breakdown"]]
+    week["events_by_day"] = {day: list(events) for day, events in week["events_by_day"].items()}
+    return week
+
+
+@lru_cache(maxsize=16)
+def _cached_week_agenda(week_start_str: str, stamp: Tuple[int, int, int]) -> Dict:
+    """按 (周一日期, 日历状态) 缓存本周日程，日历被修改后自动失效"""
+    week_start = datetime.strptime(week_start_str, "%Y-%m-%d")
     week_end = week_start + timedelta(days=6)
 
     week_events = {}
@@ -194,7 +378,7 @@ def get_week_agenda(start_date: str = None) -> Dict:
     for i in range(7):
         day = week_start + timedelta(days=i)
         day_str = day.strftime("%Y-%m-%d")
-        day_events = [e for e in CALENDAR_STORE["events"] if e.get("date") == day_str]
+        day_events = _events_on(day_str)
         week_events[day_str] = sorted(day_events, key=lambda x: x.get("start", "00:00"))
 
         # 计算每日统计
@@ -202,8 +386,8 @@ def get_week_agenda(start_date: str = None) -> Dict:
         for e in day_events:
             start_time = e.get("start", "00:00")
             end_time = e.get("end", "00:00")
-            start_min = int(start_time.split(":")[0]) * 60 + int(start_time.split(":")[1])
-            end_min = int(end_time.split(":")[0]) * 60 + int(end_time.split(":")[1])
+            start_min = _to_minutes(start_time)
+            end_min = _to_minutes(end_time)
             total_minutes += (end_min - start_min)
 
         weekday_names = ["周一", "周二", "周三", "周四", "周五", "周六", "周日"]
@@ -242,23 +426,7 @@ def check_conflicts(date: str, start: str, end: str) -> Dict:
     """
     initialize_calendar()
 
-    start_min = int(start.split(":")[0]) * 60 + int(start.split(":")[1])
-    end_min = int(end.split(":")[0]) * 60 + int(end.split(":")[1])
-
-    conflicts = []
-
-    for event in CALENDAR_STORE["events"]:
-        if event.get("date") != date:
-            continue
-
-        e_start = event.get("start", "00:00")
-        e_end = event.get("end", "00:00")
-        e_start_min = int(e_start.split(":")[0]) * 60 + int(e_start.split(":")[1])
-        e_end_min = int(e_end.split(":")[0]) * 60 + int(e_end.split(":")[1])
-
-        # 检查重叠
-        if not (end_min <= e_start_min or start_min >= e_end_min):
-            conflicts.append(event)
+    conflicts = _find_conflicts(date, start, end)
 
     return {
         "status": "success",
@@ -271,6 +439,7 @@ def check_conflicts(date: str, start: str, end: str) -> Dict:
 def get_free_slots(date: str, min_duration: int = 30) -> Dict:
     """
     获取空闲时段
+    （结果按日历修改版本缓存，返回结果字典及各空闲时段的副本）
 
     Args:
         date: 日期
@@ -281,12 +450,25 @@ def get_free_slots(date: str, min_duration: int = 30) -> Dict:
     """
     initialize_calendar()
 
+    cached = _cached_free_slots(date, min_duration, _calendar_stamp())
+    slots = [dict(slot) for slot in cached["free_slots"]]
+    free = dict(cached, free_slots=slots)
+    # longest_slot 指向复制后列表中的对应时段
+    longest = cached["longest_slot"]
+    if longest is not None:
+        free["longest_slot"] = next(copy for slot, copy in zip(cached["free_slots"], slots) if slot is longest)
+    return free
+
+
+@lru_cache(maxsize=32)
+def _cached_free_slots(date: str, min_duration: int, stamp: Tuple[int, int, int]) -> Dict:
+    """按 (日期, 最小时长, 日历状态) 缓存空闲时段，日历被修改后自动失效"""
     # 工作时间范围
     work_start = 9 * 60  # 9:00
     work_end = 18 * 60   # 18:00
 
     # 获取当天所有事件
-    day_events = [e for e in CALENDAR_STORE["events"] if e.get("date") == date]
+    day_events = _events_on(date)
     sorted_events = sorted(day_events, key=lambda x: x.get("start", "00:00"))
 
     # 找出空闲时段
@@ -296,8 +478,8 @@ def get_free_slots(date: str, min_duration: int = 30) -> Dict:
     for event in sorted_events:
         e_start = event.get("start", "09:00")
         e_end = event.get("end", "09:00")
-        e_start_min = int(e_start.split(":")[0]) * 60 + int(e_start.split(":")[1])
-        e_end_min = int(e_end.split(":")[0]) * 60 + int(e_end.split(":")[1])
+        e_start_min = _to_minutes(e_start)
+        e_end_min = _to_minutes(e_end)
 
         if e_start_min > current_time:
             gap = e_start_min - current_time
@@ -338,6 +520,7 @@ def get_free_slots(date: str, min_duration: int = 30) -> Dict:
 def clear_calendar():
     """清空日历（用于测试）"""
     CALENDAR_STORE["events"] = []
+    _touch_calendar()
     return {"status": "success", "message": "日历已清空"}
 
 
@@ -356,6 +539,8 @@ def delete_event(event_id: str) -> Dict:
     for i, event in enumerate(CALENDAR_STORE["events"]):
         if event.get("id") == event_id:
             deleted = CALENDAR_STORE["events"].pop(i)
+            _invalidate_event_index()
+            _touch_calendar()
             return {
                 "status": "success",
                 "message": f"已删除: {deleted.get('title', '未知事件')}",
@@ -389,24 +574,20 @@ def update_event(event_id: str, updates: Dict) -> Dict:
                 new_start = updates.get("start", event.get("start"))
                 new_end = updates.get("end", event.get("end"))
 
-                # 临时移除当前事件再检查
-                temp_events = [e for e in CALENDAR_STORE["events"] if e.get("id") != event_id]
-                original_events = CALENDAR_STORE["events"]
-                CALENDAR_STORE["events"] = temp_events
-
-                conflicts = check_conflicts(new_date, new_start, new_end)
-
-                CALENDAR_STORE["events"] = original_events
+                # 检查时跳过当前事件本身
+                conflicts = _find_conflicts(new_date, new_start, new_end, exclude=event)
 
-                if conflicts.get("has_conflict"):
+                if conflicts:
                     return {
                         "status": "warning",
                         "message": "更新后存在时间冲突",
-                        "conflicts": conflicts.get("conflicting_events", [])
+                        "conflicts": conflicts
                     }
 
             # 应用更新
             event.update(updates)
+            _invalidate_event_index()
+            _touch_calendar()
             event["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
             return {
@@ -5,7 +5,7 @@ Calendar Report Module - 日历报告模块
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from .calendar_manager import get_today_agenda, get_week_agenda, get_free_slots
+from .calendar_manager import get_today_agenda, get_week_agenda, get_free_slots, _to_minutes
 from .meeting_scheduler import calculate_meeting_fatigue
 from .timezone_manager import get_world_clock
 
@@ -195,8 +195,8 @@ def generate_meeting_summary(events: List[Dict]) -> str:
         # 计算时长
         start = e.get("start", "09:00")
         end = e.get("end", "10:00")
-        start_min = int(start.split(":")[0]) * 60 + int(start.split(":")[1])
-        end_min = int(end.split(":")[0]) * 60 + int(end.split(":")[1])
+        start_min = _to_minutes(start)
+        end_min = _to_minutes(end)
         total_minutes += (end_min - start_min)
 
     # 基本统计
@@ -253,8 +253,8 @@ def analyze_time_allocation(events: List[Dict], period_days: int = 7) -> Dict:
         # 时长
         start = e.get("start", "09:00")
         end = e.get("end", "10:00")
-        start_min = int(start.split(":")[0]) * 60 + int(start.split(":")[1])
-        end_min = int(end.split(":")[0]) * 60 + int(end.split(":")[1])
+        start_min = _to_minutes(start)
+        end_min = _to_minutes(end)
         duration = end_min - start_min
         total_minutes += duration
 